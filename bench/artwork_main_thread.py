@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# artwork_main_thread.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Measure the main-thread time spent setting the cover of a card.
+
+The old path handed the file path to the main loop, which decoded the full
+JPEG in Gtk.Image.set_from_file. The new path decodes and downscales on a
+worker thread with HTTextureCache and only calls set_from_paintable in the
+idle callback. Only the time spent inside the idle callbacks is reported,
+since that is what blocks the UI.
+
+Usage: python3 bench/artwork_main_thread.py [--cards 500] [--edge 640]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("GdkPixbuf", "2.0")
+
+from gi.repository import GdkPixbuf, GLib, Gtk  # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "lib"))
+
+from texture_cache import HTTextureCache  # noqa: E402
+
+# Cards show their cover at this size, see card_widget.blp
+CARD_SIZE = 160
+
+
+def make_covers(directory: str, count: int, edge: int) -> list:
+    """Write count distinct JPEG covers, like the image cache would"""
+    paths = []
+    for index in range(count):
+        pixbuf = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, False, 8, edge, edge)
+        pixbuf.fill((index * 2654435761) & 0xFFFFFF00)
+        path = os.path.join(directory, f"{index}_{edge}.jpg")
+        pixbuf.savev(path, "jpeg", ["quality"], ["90"])
+        paths.append(path)
+    return paths
+
+
+def run_idle(callbacks: list) -> list:
+    """Run the callbacks as idle sources and return their durations"""
+    durations = []
+    loop = GLib.MainLoop()
+    remaining = [len(callbacks)]
+
+    def _timed(callback):
+        start = time.perf_counter()
+        callback()
+        durations.append(time.perf_counter() - start)
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            loop.quit()
+        return GLib.SOURCE_REMOVE
+
+    for callback in callbacks:
+        GLib.idle_add(_timed, callback)
+    loop.run()
+    return durations
+
+
+def bench_old(paths: list) -> list:
+    images = [Gtk.Image(pixel_size=CARD_SIZE) for _path in paths]
+    return run_idle([
+        lambda image=image, path=path: image.set_from_file(path)
+        for image, path in zip(images, paths)
+    ])
+
+
+def bench_new(paths: list) -> list:
+    texture_cache = HTTextureCache()
+    images = [Gtk.Image(pixel_size=CARD_SIZE) for _path in paths]
+
+    # Decoding happens on the artwork workers, off the main thread
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        textures = list(
+            executor.map(lambda path: texture_cache.load(path, CARD_SIZE), paths)
+        )
+
+    return run_idle([
+        lambda image=image, texture=texture: image.set_from_paintable(texture)
+        for image, texture in zip(images, textures)
+    ])
+
+
+def report(name: str, durations: list) -> None:
+    durations_ms = sorted(duration * 1000 for duration in durations)
+    p95 = durations_ms[int(len(durations_ms) * 0.95) - 1]
+    print(
+        f"{name:>18}: mean {statistics.mean(durations_ms):7.3f} ms/card, "
+        f"p95 {p95:7.3f} ms, total {sum(durations_ms):8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--edge", type=int, default=640, help="cover edge in px")
+    args = parser.parse_args()
+
+    Gtk.init()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_covers(directory, args.cards, args.edge)
+        print(f"{args.cards} cards, {args.edge}px covers shown at {CARD_SIZE}px")
+        report("set_from_file", bench_old(paths))
+        report("set_from_paintable", bench_new(paths))
+
+
+if __name__ == "__main__":
+    main()
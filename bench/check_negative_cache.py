@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# check_negative_cache.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Check that HTCache remembers objects TIDAL does not have.
+
+A fake session answers every request with an HTTPError, like TIDAL does for
+a missing or region blocked id, and counts the requests. Asking HTCache for
+the same artist twice must raise both times but only make one request. A 403,
+which TIDAL also answers for an expired session, must not be remembered.
+
+Usage: python3 bench/check_negative_cache.py
+"""
+
+import importlib
+import os
+import sys
+import types
+
+import requests
+
+LIB_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "lib")
+
+
+def import_cache():
+    """Import cache.py without lib/__init__.py, which needs GTK"""
+    package = types.ModuleType("htlib")
+    package.__path__ = [LIB_DIR]
+    sys.modules["htlib"] = package
+    return importlib.import_module("htlib.cache")
+
+
+class FakeRequest:
+    def __init__(self, status: int) -> None:
+        self.status = status
+        self.calls = 0
+
+    def request(self, method: str, path: str) -> requests.Response:
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.status
+        response._content = b'{"status": %d, "userMessage": "Not found"}' % (
+            self.status
+        )
+        raise requests.HTTPError(f"{self.status} for {path}", response=response)
+
+
+class FakeSession:
+    def __init__(self, status: int) -> None:
+        self.request = FakeRequest(status)
+
+    def parse_artist(self, data):
+        raise AssertionError("a failed request must not be parsed")
+
+
+def check(cache_module, status: int, expected_calls: int) -> None:
+    session = FakeSession(status)
+    cache = cache_module.HTCache(session)
+
+    try:
+        for _attempt in range(2):
+            try:
+                cache.get_artist("404404")
+            except requests.HTTPError:
+                pass
+            else:
+                raise AssertionError("the artist should not exist")
+    finally:
+        cache.close()
+
+    assert session.request.calls == expected_calls, (
+        f"HTTP {status}: {session.request.calls} requests, expected {expected_calls}"
+    )
+    print(f"HTTP {status}: {session.request.calls} requests for two lookups")
+
+
+def main() -> None:
+    cache_module = import_cache()
+    for status in cache_module.UNAVAILABLE_STATUSES:
+        check(cache_module, status, 1)
+    check(cache_module, 403, 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# gapless_gap.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Measure the gap between two tracks played back to back.
+
+Two sine tone FLAC files are generated at the given sample rates. The second
+one is queued from about-to-finish, like PlayerObject.play_next_gapless does,
+and the audio goes through the same output bin as the app: queue,
+audioconvert, audioresample and the sink.
+
+Two values are reported at the sink pad for the transition:
+the hole in the running time between the two tracks, and the wall clock
+stall beyond the duration of the last buffer, which includes the sink
+reconnecting after a format change. The default sink needs a running
+PipeWire daemon. With --max-gap the script fails if a stall is longer.
+
+Usage: python3 bench/gapless_gap.py [--rates 44100 96000] [--sink pipewiresink]
+                                    [--max-gap MS]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import gi
+
+gi.require_version("Gst", "1.0")
+
+from gi.repository import GLib, Gst  # noqa: E402
+
+SAMPLES_PER_BUFFER = 1024
+
+
+def make_tone(path: str, rate: int, seconds: float) -> None:
+    """Encode a sine tone into a FLAC file"""
+    buffers = int(rate * seconds / SAMPLES_PER_BUFFER)
+    pipeline = Gst.parse_launch(
+        f"audiotestsrc wave=sine freq=440 num-buffers={buffers} "
+        f"samplesperbuffer={SAMPLES_PER_BUFFER} "
+        f"! audio/x-raw,format=S16LE,rate={rate},channels=2 "
+        f"! flacenc ! filesink location={path}"
+    )
+    pipeline.set_state(Gst.State.PLAYING)
+    message = pipeline.get_bus().timed_pop_filtered(
+        Gst.CLOCK_TIME_NONE, Gst.MessageType.EOS | Gst.MessageType.ERROR
+    )
+    pipeline.set_state(Gst.State.NULL)
+    if message.type == Gst.MessageType.ERROR:
+        raise RuntimeError(message.parse_error()[0].message)
+
+
+class GapProbe:
+    """Record the caps of each track and the transitions at a sink pad"""
+
+    def __init__(self, pad: Gst.Pad) -> None:
+        self.segment: Gst.Segment | None = None
+        self.caps: list = []
+        self.gaps: list = []
+        self._new_track = False
+        self._last_end: int | None = None
+        self._last_arrival: int | None = None
+        self._last_duration = 0
+
+        pad.add_probe(Gst.PadProbeType.EVENT_DOWNSTREAM, self._on_event)
+        pad.add_probe(Gst.PadProbeType.BUFFER, self._on_buffer)
+
+    def _on_event(self, pad: Gst.Pad, info: Gst.PadProbeInfo):
+        event = info.get_event()
+        if event.type == Gst.EventType.STREAM_START:
+            self._new_track = True
+        elif event.type == Gst.EventType.SEGMENT:
+            self.segment = event.parse_segment()
+        elif event.type == Gst.EventType.CAPS and self._new_track:
+            self.caps.append(event.parse_caps().to_string())
+        return Gst.PadProbeReturn.OK
+
+    def _on_buffer(self, pad: Gst.Pad, info: Gst.PadProbeInfo):
+        buffer = info.get_buffer()
+        arrival = time.monotonic_ns()
+        start = self.segment.to_running_time(Gst.Format.TIME, buffer.pts)
+
+        if self._new_track and self._last_end is not None:
+            hole = start - self._last_end
+            stall = arrival - self._last_arrival - self._last_duration
+            self.gaps.append((hole, stall))
+        self._new_track = False
+
+        self._last_end = start + buffer.duration
+        self._last_arrival = arrival
+        self._last_duration = buffer.duration
+        return Gst.PadProbeReturn.OK
+
+
+def make_output_bin(sink: Gst.Element) -> Gst.Bin:
+    """Build the audio output bin of PlayerObject around a sink"""
+    output = Gst.Bin.new("audio-output")
+    elements = [
+        Gst.ElementFactory.make("queue", None),
+        Gst.ElementFactory.make("audioconvert", None),
+        Gst.ElementFactory.make("audioresample", None),
+        sink,
+    ]
+    for element in elements:
+        output.add(element)
+    for upstream, downstream in zip(elements, elements[1:]):
+        upstream.link(downstream)
+    output.add_pad(Gst.GhostPad.new("sink", elements[0].get_static_pad("sink")))
+    return output
+
+
+def measure(paths: list, sink_name: str) -> GapProbe:
+    sink = Gst.ElementFactory.make(sink_name, None)
+    if sink is None:
+        raise RuntimeError(f"{sink_name} is not available")
+
+    playbin = Gst.ElementFactory.make("playbin3", None)
+    probe = GapProbe(sink.get_static_pad("sink"))
+    playbin.set_property("audio-sink", make_output_bin(sink))
+    playbin.set_property("uri", Gst.filename_to_uri(paths[0]))
+
+    remaining = list(paths[1:])
+
+    def _on_about_to_finish(playbin):
+        if remaining:
+            playbin.set_property("uri", Gst.filename_to_uri(remaining.pop(0)))
+
+    playbin.connect("about-to-finish", _on_about_to_finish)
+
+    loop = GLib.MainLoop()
+
+    def _on_message(bus, message):
+        if message.type == Gst.MessageType.ERROR:
+            print(f"Error: {message.parse_error()[0].message}")
+            loop.quit()
+        elif message.type == Gst.MessageType.EOS:
+            loop.quit()
+
+    bus = playbin.get_bus()
+    bus.add_signal_watch()
+    bus.connect("message", _on_message)
+
+    playbin.set_state(Gst.State.PLAYING)
+    loop.run()
+    playbin.set_state(Gst.State.NULL)
+    bus.remove_signal_watch()
+    return probe
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rates", type=int, nargs="+", default=[44100, 96000])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--sink", default="pipewiresink")
+    parser.add_argument(
+        "--max-gap", type=float, help="fail if a stall is longer, in ms"
+    )
+    args = parser.parse_args()
+
+    Gst.init(None)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index, rate in enumerate(args.rates):
+            path = os.path.join(directory, f"{index}_{rate}.flac")
+            make_tone(path, rate, args.seconds)
+            paths.append(path)
+
+        probe = measure(paths, args.sink)
+
+    for index, caps in enumerate(probe.caps, 1):
+        print(f"track {index} at the sink: {caps}")
+    for index, (hole, stall) in enumerate(probe.gaps, 1):
+        print(
+            f"transition {index}: running time hole {hole / Gst.MSECOND:7.3f} ms, "
+            f"wall clock stall {stall / Gst.MSECOND:7.3f} ms"
+        )
+
+    if args.max_gap is not None:
+        if len(probe.gaps) != len(args.rates) - 1:
+            sys.exit("not every transition was measured")
+        if any(stall / Gst.MSECOND > args.max_gap for _hole, stall in probe.gaps):
+            sys.exit(f"a transition stalled for more than {args.max_gap} ms")
+
+
+if __name__ == "__main__":
+    main()
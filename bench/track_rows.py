@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# track_rows.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Measure how many track rows per second can be created and bound.
+
+HTGenericTrackWidget rows are created and bound to generated tracks, then
+rebound to other tracks like the recycled rows of HTTrackListView. The
+menu of a row is also prepared repeatedly, as GTK does every time it is
+about to be shown, to check that it is only built once.
+
+With --baseline every row also builds what rows built for themselves before
+the menu was shared: its own menu model, set on the menu button so the
+popover is created with the row, an action group and a notify::active
+handler. Running with and without it gives the before and after numbers.
+
+The widgets are loaded from an installed or built High Tide, the directory
+holding the high_tide package and high-tide.gresource, for example
+/app/share/high-tide in the Flatpak.
+
+Usage: python3 bench/track_rows.py PKGDATADIR [--rows 2000] [--menus 100]
+                                   [--baseline]
+"""
+
+import argparse
+import gettext
+import os
+import sys
+import time
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+
+from gi.repository import Adw, Gio, Gtk  # noqa: E402
+from tidalapi import Album, Artist, Track  # noqa: E402
+
+
+class NoArtwork:
+    """Artwork loader dropping every request, so no session is needed"""
+
+    def submit(self, *args, **kwargs) -> None:
+        pass
+
+
+# The items of the menu each row had in its template
+OLD_MENU_ITEMS = [
+    ("Play next", "trackwidget.play-next"),
+    ("Add to queue", "trackwidget.add-to-queue"),
+    ("Add to my collection", "trackwidget.add-to-my-collection"),
+    ("Copy share url", "trackwidget.copy-share-url"),
+]
+
+
+def add_old_menu(row: Gtk.Widget) -> None:
+    """Build the menu of a row the way rows did before it was shared"""
+    menu = Gio.Menu()
+    for label, action in OLD_MENU_ITEMS:
+        menu.append(label, action)
+    menu.append_submenu("Add to a playlist", Gio.Menu())
+    row.menu_button.set_menu_model(menu)
+
+    row.insert_action_group("trackwidget", Gio.SimpleActionGroup())
+    row.menu_button.connect("notify::active", lambda *args: None)
+
+
+def make_tracks(count: int) -> list:
+    """Create tracks with the attributes the rows show, without a session"""
+    tracks = []
+    for index in range(count):
+        artist = Artist.__new__(Artist)
+        artist.id = index
+        artist.name = f"Artist {index}"
+
+        album = Album.__new__(Album)
+        album.id = index
+        album.name = f"Album {index}"
+
+        track = Track.__new__(Track)
+        track.id = index
+        track.name = f"Track {index}"
+        track.full_name = track.name
+        track.album = album
+        track.artists = [artist]
+        track.explicit = index % 5 == 0
+        track.duration = 180 + index % 120
+        track.available = True
+        tracks.append(track)
+    return tracks
+
+
+def rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:9.0f} rows/s ({seconds * 1000 / count:.3f} ms/row)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pkgdatadir", help="directory of the installed app")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--menus", type=int, default=100)
+    parser.add_argument(
+        "--baseline", action="store_true", help="build a menu with every row"
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(1, args.pkgdatadir)
+    gettext.install("high-tide")
+    Gio.Resource.load(
+        os.path.join(args.pkgdatadir, "high-tide.gresource")
+    )._register()
+    Adw.init()
+
+    from high_tide.lib import utils
+    from high_tide.widgets.generic_track_widget import HTGenericTrackWidget
+
+    utils.artwork_loader = NoArtwork()
+
+    tracks = make_tracks(args.rows * 2)
+    first, second = tracks[: args.rows], tracks[args.rows :]
+
+    start = time.perf_counter()
+    rows = [HTGenericTrackWidget() for _track in first]
+    if args.baseline:
+        for row in rows:
+            add_old_menu(row)
+    created = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row, track in zip(rows, first):
+        row.set_track(track)
+    bound = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row, track in zip(rows, second):
+        row.unbind()
+        row.set_track(track)
+    rebound = time.perf_counter() - start
+
+    print(f"{args.rows} rows" + (" with the old menu" if args.baseline else ""))
+    print(f"  create: {rate(args.rows, created)}")
+    print(f"    bind: {rate(args.rows, bound)}")
+    print(f"  rebind: {rate(args.rows, rebound)}")
+
+    if args.baseline:
+        return
+
+    row = rows[0]
+    row._create_menu(row.menu_button)
+    handlers = len(row.signals)
+    start = time.perf_counter()
+    for _index in range(args.menus):
+        row._create_menu(row.menu_button)
+    prepared = time.perf_counter() - start
+
+    print(
+        f"  menu prepared {args.menus} times: "
+        f"{prepared * 1000 / args.menus:.3f} ms each, "
+        f"{len(row.signals) - handlers} handlers added after the first"
+    )
+    if len(row.signals) != handlers:
+        sys.exit("the menu of a row is built more than once")
+
+
+if __name__ == "__main__":
+    main()
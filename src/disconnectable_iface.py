@@ -25,10 +25,11 @@ class IDisconnectable:
     """
     A class that provides automatic resource cleanup for GTK widgets and other objects.
 
-    This class manages three types of resources that need cleanup:
+    This class manages four types of resources that need cleanup:
     - GTK signals (stored in self.signals)
     - Data bindings (stored in self.bindings)
     - Child disconnectable widgets (stored in self.disconnectables)
+    - Pending asynchronous operations (stored in self.cancellables)
 
     Usage:
     ------
@@ -53,13 +54,19 @@ class IDisconnectable:
     >>> child_widget = SomeDisconnectableWidget()
     ... self.disconnectables.append(child_widget)
 
-    5. Call disconnect_all() when the widget is being destroyed:
+    5. When starting asynchronous work like loading artwork, store the
+        GCancellable so it is cancelled with the widget:
+
+    >>> self.cancellables.append(cancellable)
+
+    6. Call disconnect_all() when the widget is being destroyed:
     """
 
     def __init__(self) -> None:
         self.signals: List[Tuple[Any, int]] = []
         self.bindings: List[Any] = []
         self.disconnectables: List["IDisconnectable"] = []
+        self.cancellables: List[Any] = []
 
     def connect_signal(
         self, g_object: Any, signal_name: str, callback_func: Any, *args
@@ -81,10 +88,15 @@ class IDisconnectable:
         """Disconnect all tracked signals and child disconnectable objects.
 
         This method should be called when the widget is being removed to ensure
-        proper cleanup. It disconnects all tracked signal connections and
-        recursively calls disconnect_all on child disconnectable objects.
+        proper cleanup. It disconnects all tracked signal connections, cancels
+        pending operations and recursively calls disconnect_all on child
+        disconnectable objects.
         """
 
+        for cancellable in self.cancellables:
+            cancellable.cancel()
+        del self.cancellables
+
         for obj, signal_id in self.signals:
             if obj.handler_is_connected(signal_id):
                 obj.disconnect(signal_id)
@@ -107,6 +119,7 @@ class IDisconnectable:
         self.signals = []
         self.bindings = []
         self.disconnectables = []
+        self.cancellables = []
 
     def __repr__(self, *args) -> str | None:
         return self.__gtype_name__ if self.__gtype_name__ else None
@@ -1,5 +1,14 @@
+from .artwork_loader import HTArtworkLoader, Priority
+from .audio_cache import HTAudioCache
 from .cache import HTCache
 from .discord_rpc import *
+from .file_cache import HTFileCache
+from .http_client import HTHttpClient
+from .image_cache import HTImageCache
+from .manifest_store import HTManifestStore
+from .metadata_store import HTMetadataStore
 from .player_object import PlayerObject, RepeatType
 from .secret_storage import SecretStore
+from .stream_prefetcher import HTStreamPrefetcher
+from .texture_cache import HTTextureCache
 from .utils import *
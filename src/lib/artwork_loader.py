@@ -0,0 +1,108 @@
+# artwork_loader.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import itertools
+import logging
+import queue
+import threading
+from enum import IntEnum
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class _Job:
+    __slots__ = ("function", "args", "mapped", "cancellable", "deferred")
+
+    def __init__(
+        self, function: Callable, args: tuple, mapped: bool, cancellable: Any
+    ) -> None:
+        self.function = function
+        self.args = args
+        self.mapped = mapped
+        self.cancellable = cancellable
+        self.deferred = False
+
+
+class HTArtworkLoader:
+    """Fixed-size pool of worker threads loading artwork by priority.
+
+    Jobs are run in priority order, and in submission order for the same
+    priority. A job is dropped without running if its cancellable was
+    cancelled while it was waiting, and a non high priority job whose
+    widget is not mapped yet is moved once behind the low priority jobs, so
+    what is on screen loads first. The mapped state is read when the job
+    is submitted, since GTK can only be used from the main thread.
+    """
+
+    def __init__(self, n_workers: int = 4) -> None:
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._counter = itertools.count()
+
+        for index in range(n_workers):
+            threading.Thread(
+                target=self._work, name=f"artwork-loader-{index}", daemon=True
+            ).start()
+
+    def submit(
+        self,
+        function: Callable,
+        *args,
+        widget: Any = None,
+        cancellable: Any = None,
+        priority: Priority = Priority.NORMAL,
+    ) -> None:
+        """Queue a function to be run on one of the worker threads.
+
+        Must be called from the main thread when a widget is given.
+
+        Args:
+            function: The function to run, it is called with *args
+            widget: Optional widget the job loads artwork for, used to load
+                mapped widgets first
+            cancellable: Optional GCancellable, the job is skipped if it gets
+                cancelled before it starts
+            priority (Priority): The job priority (default: NORMAL)
+        """
+        mapped = widget is None or widget.get_mapped()
+        job = _Job(function, args, mapped, cancellable)
+        self._queue.put((priority, next(self._counter), job))
+
+    def _work(self) -> None:
+        while True:
+            priority, _count, job = self._queue.get()
+
+            if job.cancellable is not None and job.cancellable.is_cancelled():
+                continue
+
+            if not job.mapped and priority != Priority.HIGH and not job.deferred:
+                job.deferred = True
+                self._queue.put((Priority.LOW, next(self._counter), job))
+                continue
+
+            try:
+                job.function(*job.args)
+            except Exception:
+                logger.exception("Error while loading artwork")
@@ -0,0 +1,161 @@
+# audio_cache.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import os
+import queue
+import threading
+from typing import List
+
+import requests
+
+from .http_client import HTHttpClient
+from .file_cache import HTFileCache
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+
+
+class HTAudioCache(HTFileCache):
+    """Size-bounded on-disk cache of recently played tracks.
+
+    Tracks are stored as one file per track id and audio quality. BTS
+    streams are saved as they are, and the segments of DASH streams are
+    concatenated into a single fragmented MP4, so both can be played back
+    from a file:// URI. Tracks are downloaded one at a time in the
+    background while the track before them plays, so playbin never streams
+    the same track at the same time. A max_size of 0 disables the cache.
+    """
+
+    label = "Audio cache"
+
+    def __init__(
+        self, directory: str, http_client: HTHttpClient, max_size: int = 0
+    ) -> None:
+        super().__init__(directory, max_size)
+
+        self.http_client = http_client
+
+        self.hits = 0
+        self.misses = 0
+
+        self._queue: queue.Queue = queue.Queue()
+        self._queued: set[str] = set()
+
+        threading.Thread(target=self._work, name="audio-cache", daemon=True).start()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @staticmethod
+    def name_for(track_id: str, quality: str) -> str:
+        """Get the file name of a track in the cache.
+
+        Args:
+            track_id (str): The TIDAL track ID
+            quality (str): The audio quality of the stream
+
+        Returns:
+            str: The file name inside the cache directory
+        """
+        return f"{track_id}_{quality}"
+
+    def get(self, track_id: str, quality: str) -> str | None:
+        """Get the path of a cached track, counting hits and misses.
+
+        Args:
+            track_id (str): The TIDAL track ID
+            quality (str): The audio quality of the stream
+
+        Returns:
+            str: The path of the cached track, or None if it is not cached
+        """
+        if not self.enabled:
+            return None
+
+        name = self.name_for(track_id, quality)
+        path = self.lookup(name)
+        if path is not None and not os.path.isfile(path):
+            # Removed behind the index, playbin could not open it
+            self.discard(name)
+            path = None
+        if path is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        logger.info(
+            f"Audio cache {'hit' if path else 'miss'} for {track_id} "
+            f"({self.hits} hits, {self.misses} misses)"
+        )
+        return path
+
+    def cache_stream(self, track_id: str, quality: str, urls: List[str]) -> None:
+        """Queue the download of a track into the cache.
+
+        Args:
+            track_id (str): The TIDAL track ID
+            quality (str): The audio quality of the stream
+            urls: The URL of the file, or the URLs of the DASH segments in
+                playback order
+        """
+        if not self.enabled:
+            return
+
+        name = self.name_for(track_id, quality)
+        with self._lock:
+            if name in self._queued or name in self.entries:
+                return
+            self._queued.add(name)
+
+        self._queue.put((name, urls))
+
+    def _work(self) -> None:
+        while True:
+            name, urls = self._queue.get()
+
+            tmp_path = self.tmp_path_for(name)
+            try:
+                with open(tmp_path, "wb") as file:
+                    for url in urls:
+                        with self.http_client.session.get(
+                            url, stream=True, timeout=self.http_client.timeout
+                        ) as response:
+                            response.raise_for_status()
+                            for chunk in response.iter_content(CHUNK_SIZE):
+                                file.write(chunk)
+                if self.enabled:
+                    self.add_file(name, tmp_path)
+            except (OSError, requests.RequestException):
+                logger.exception(f"Could not cache {name}")
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                with self._lock:
+                    self._queued.discard(name)
+
+    def log_stats(self) -> None:
+        """Log the hit rate of the cache"""
+        total = self.hits + self.misses
+        if total:
+            logger.info(
+                f"Audio cache: {self.hits}/{total} hits "
+                f"({100 * self.hits // total}%), {self.size // (1024 * 1024)} MB"
+            )
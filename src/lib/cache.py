@@ -17,23 +17,457 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Any, Dict
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
+import requests
 from tidalapi import Album, Artist, Mix, Playlist, Track
+from tidalapi.exceptions import (
+    AssetNotAvailable,
+    MetadataNotAvailable,
+    ObjectNotFound,
+)
+
+from .metadata_store import TTLS, HTMetadataStore
+
+logger = logging.getLogger(__name__)
+
+# API path of each object type that can be persisted
+ENDPOINTS: Dict[str, str] = {
+    "artist": "artists/{}",
+    "album": "albums/{}",
+    "track": "tracks/{}",
+    "playlist": "playlists/{}",
+}
+
+# Default number of objects kept in memory for each type
+CAPACITIES: Dict[str, int] = {
+    "artist": 500,
+    "album": 1000,
+    "track": 2000,
+    "playlist": 200,
+    "mix": 100,
+}
+
+# How long a missing or region blocked object is remembered, in seconds
+NEGATIVE_TTL = 300
+NEGATIVE_CAPACITY = 500
+
+# HTTP statuses TIDAL answers with for objects that are missing or not
+# available in the region. 404 responses carry a JSON body, so tidalapi does
+# not always turn them into ObjectNotFound and they arrive as HTTPError.
+# 403 is left out, since it is also the answer for an expired session
+UNAVAILABLE_STATUSES = (404, 451)
+
+# Lookups queued with resolve() within this many seconds are fetched together
+BATCH_WINDOW = 0.05
+# Maximum number of objects fetched at the same time by a batch
+BATCH_WORKERS = 6
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """Check if an error means the object does not exist for this session"""
+    if isinstance(error, (ObjectNotFound, MetadataNotAvailable, AssetNotAvailable)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in UNAVAILABLE_STATUSES
+    return False
+
+
+class HTLRUCache:
+    """Thread safe LRU mapping with a fixed capacity and usage counters.
+
+    Every item is stored with the time it was fetched, so callers can decide
+    if it is still fresh.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+
+        self.items: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        """Get an item and mark it as recently used.
+
+        Args:
+            key: The item key, compared as a string
+
+        Returns:
+            The cached item, or None if it is not cached
+        """
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: Any) -> Tuple[Any, float] | None:
+        """Get an item with its fetch time and mark it as recently used.
+
+        Args:
+            key: The item key, compared as a string
+
+        Returns:
+            tuple: The cached item and its fetch time, or None if not cached
+        """
+        key = str(key)
+        with self._lock:
+            entry = self.items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if an item is cached, without counting a hit or a miss"""
+        with self._lock:
+            return str(key) in self.items
+
+    def put(self, key: Any, item: Any, fetched: float | None = None) -> None:
+        """Add an item, evicting the least recently used one if full.
+
+        Args:
+            key: The item key, compared as a string
+            item: The item to cache
+            fetched (float): When the item was fetched, defaults to now
+        """
+        key = str(key)
+        with self._lock:
+            self.items[key] = (item, time.time() if fetched is None else fetched)
+            self.items.move_to_end(key)
+            while len(self.items) > self.capacity:
+                self.items.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Any) -> None:
+        """Remove an item if it is cached.
+
+        Args:
+            key: The item key, compared as a string
+        """
+        with self._lock:
+            self.items.pop(str(key), None)
+
+    def clear(self) -> None:
+        """Remove every item"""
+        with self._lock:
+            self.items.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the usage counters.
+
+        Returns:
+            dict: The number of cached "items", "hits", "misses" and "evictions"
+        """
+        with self._lock:
+            return {
+                "items": len(self.items),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
 
 
 class HTCache:
-    artists: Dict[str, Artist] = {}
-    albums: Dict[str, Album] = {}
-    tracks: Dict[str, Track] = {}
-    playlists: Dict[str, Playlist] = {}
-    mixes: Dict[str, Mix] = {}
+    """Per-session cache of TIDAL objects.
+
+    Each object type is kept in its own bounded LRU in front of the optional
+    persistent metadata store. A new instance should be created for every
+    session, so objects never outlive the session they were fetched with.
 
-    def __init__(self, session: Any) -> None:
+    Objects older than the TTL of their type are still returned right away,
+    while a fresh copy is fetched in the background. Objects that do not
+    exist or are blocked in the region are remembered for NEGATIVE_TTL
+    seconds, and asking for them again raises the same error without a
+    request.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        store: HTMetadataStore | None = None,
+        capacities: Dict[str, int] | None = None,
+    ) -> None:
         self.session = session
+        self.store = store
+
+        capacities = {**CAPACITIES, **(capacities or {})}
+
+        self.artists = HTLRUCache(capacities["artist"])
+        self.albums = HTLRUCache(capacities["album"])
+        self.tracks = HTLRUCache(capacities["track"])
+        self.playlists = HTLRUCache(capacities["playlist"])
+        self.mixes = HTLRUCache(capacities["mix"])
+
+        self.caches: Dict[str, HTLRUCache] = {
+            "artist": self.artists,
+            "album": self.albums,
+            "track": self.tracks,
+            "playlist": self.playlists,
+            "mix": self.mixes,
+        }
+
+        # Errors of unavailable objects, keyed by "type:id"
+        self.unavailable = HTLRUCache(NEGATIVE_CAPACITY)
+
+        self.getters: Dict[str, Callable[[str], Any]] = {
+            "artist": self.get_artist,
+            "album": self.get_album,
+            "track": self.get_track,
+            "playlist": self.get_playlist,
+            "mix": self.get_mix,
+        }
+
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=BATCH_WORKERS, thread_name_prefix="cache-batch"
+        )
+        self._pending: Dict[str, Dict[str, List[Callable[[Any], None]]]] = {}
+        self._pending_lock = threading.Lock()
+        self._batch_timer: threading.Timer | None = None
+
+    def invalidate(self, type: str, id: str) -> None:
+        """Remove an object from memory and from the persistent store.
+
+        Args:
+            type (str): The object type, like "artist" or "album"
+            id (str): The TIDAL object ID
+        """
+        self.caches[type].invalidate(id)
+        self.unavailable.invalidate(f"{type}:{id}")
+        if self.store is not None and type in ENDPOINTS:
+            self.store.delete(type, id)
+
+    def clear(self) -> None:
+        """Remove every object kept in memory"""
+        for cache in self.caches.values():
+            cache.clear()
+        self.unavailable.clear()
+
+    def close(self) -> None:
+        """Stop the batch threads, dropping the lookups not started yet.
+
+        Must be called before the cache is replaced, its pool is not shut
+        down otherwise.
+        """
+        with self._pending_lock:
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+            self._pending = {}
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the usage counters of every object type.
+
+        Returns:
+            dict: The counters of HTLRUCache.get_stats() by object type
+        """
+        return {type: cache.get_stats() for type, cache in self.caches.items()}
+
+    def log_stats(self) -> None:
+        """Log the usage counters of every object type"""
+        for type, stats in self.get_stats().items():
+            logger.info(
+                f"Cache {type}: {stats['items']} items, {stats['hits']} hits, "
+                f"{stats['misses']} misses, {stats['evictions']} evictions"
+            )
+
+    def get_many(self, type: str, ids: Iterable[str]) -> Dict[str, Any]:
+        """Get several objects of a type, fetching the missing ones in parallel.
+
+        Args:
+            type (str): The object type, like "artist" or "album"
+            ids: The TIDAL object IDs
+
+        Returns:
+            dict: The objects by ID, without the ones that could not be fetched
+        """
+        getter = self.getters[type]
+
+        def _get(id):
+            try:
+                return getter(id)
+            except Exception as e:
+                if not _is_unavailable(e):
+                    logger.warning(f"Could not get {type} {id}: {e}")
+                return None
+
+        ids = list(dict.fromkeys(str(id) for id in ids))
+        cache = self.caches[type]
+        cached = {id for id in ids if id in cache}
+        missing = [id for id in ids if id not in cached]
+
+        # The getters count the hit or miss of every ID, so the cached objects
+        # are also taken through them, just without a thread
+        items = {id: _get(id) for id in ids if id in cached}
+        items.update(zip(missing, self._executor.map(_get, missing)))
+
+        return {id: item for id, item in items.items() if item is not None}
+
+    def resolve(self, type: str, id: str, callback: Callable[[Any], None]) -> None:
+        """Queue the lookup of an object to be fetched in the next batch.
+
+        Lookups queued within BATCH_WINDOW seconds are grouped by type and
+        fetched with get_many(), then every callback is called together from
+        the batch thread, with the object or None if it could not be fetched.
+
+        Args:
+            type (str): The object type, like "artist" or "album"
+            id (str): The TIDAL object ID
+            callback: The function called with the object
+        """
+        if type not in self.getters:
+            callback(None)
+            return
+
+        with self._pending_lock:
+            callbacks = self._pending.setdefault(type, {})
+            callbacks.setdefault(str(id), []).append(callback)
+
+            if self._batch_timer is None:
+                self._batch_timer = threading.Timer(BATCH_WINDOW, self._run_batch)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+
+    def _run_batch(self) -> None:
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {}
+            self._batch_timer = None
+
+        results = [
+            (self.get_many(type, callbacks), callbacks)
+            for type, callbacks in pending.items()
+        ]
+
+        for items, callbacks in results:
+            for id, id_callbacks in callbacks.items():
+                for callback in id_callbacks:
+                    try:
+                        callback(items.get(id))
+                    except Exception:
+                        logger.exception("Error in a cache batch callback")
+
+    def _get(
+        self,
+        type: str,
+        id: str,
+        load: Callable[[], Tuple[Any, float]],
+        fetch: Callable[[], Any],
+    ) -> Any:
+        """Get an object from memory, loading it on a miss.
+
+        Stale objects are returned as they are and refreshed in the background,
+        unavailable objects raise the error they failed with.
+
+        Args:
+            type (str): The object type, a key of CAPACITIES
+            id (str): The TIDAL object ID
+            load: A function returning the object and its fetch time, possibly
+                from the persistent store
+            fetch: A function fetching a fresh object from the TIDAL API
+
+        Returns:
+            The tidalapi object
+        """
+        cache = self.caches[type]
+
+        entry = cache.get_entry(id)
+        if entry is None:
+            key = f"{type}:{id}"
+            failure = self.unavailable.get_entry(key)
+            if failure is not None:
+                if time.time() - failure[1] < NEGATIVE_TTL:
+                    raise failure[0]
+                self.unavailable.invalidate(key)
+
+            try:
+                entry = load()
+            except Exception as e:
+                if _is_unavailable(e):
+                    self.unavailable.put(key, e)
+                raise
+
+            cache.put(id, *entry)
+
+        item, fetched = entry
+        if time.time() - fetched > TTLS[type]:
+            self._refresh(type, id, fetch)
+
+        return item
+
+    def _refresh(self, type: str, id: str, fetch: Callable[[], Any]) -> None:
+        """Fetch a fresh copy of a stale object in a background thread.
+
+        Args:
+            type (str): The object type, a key of CAPACITIES
+            id (str): The TIDAL object ID
+            fetch: A function fetching a fresh object from the TIDAL API
+        """
+        key = f"{type}:{id}"
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _thread():
+            try:
+                self.caches[type].put(id, fetch())
+            except Exception as e:
+                if _is_unavailable(e):
+                    self.caches[type].invalidate(id)
+                    self.unavailable.put(key, e)
+                else:
+                    logger.warning(f"Could not refresh {key}: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_thread, daemon=True).start()
+
+    def _get_persisted(self, type: str, id: str, parse: Callable[[Any], Any]) -> Any:
+        """Get an object of a type that can be kept in the persistent store.
+
+        Args:
+            type (str): The object type, a key of ENDPOINTS
+            id (str): The TIDAL object ID
+            parse: The session function parsing the JSON into an object
+
+        Returns:
+            The parsed tidalapi object
+        """
+
+        def _load():
+            if self.store is not None:
+                entry = self.store.get(type, id)
+                if entry is not None:
+                    data, fetched = entry
+                    return parse(data), fetched
+            return _fetch(), time.time()
+
+        def _fetch():
+            path = ENDPOINTS[type].format(id)
+            data = self.session.request.request("GET", path).json()
+            if self.store is not None:
+                self.store.put(type, id, data)
+            return parse(data)
+
+        return self._get(type, id, _load, _fetch)
 
     def get_artist(self, artist_id: str) -> Artist:
-        """Get an artist from cache or fetch from TIDAL API if not cached.
+        """Get an artist from cache, the metadata store or the TIDAL API.
 
         Args:
             artist_id (str): The TIDAL artist ID
@@ -41,14 +475,10 @@ class HTCache:
         Returns:
             Artist: The artist object from TIDAL API
         """
-        if artist_id in self.artists:
-            return self.artists[artist_id]
-        artist = Artist(self.session, artist_id)
-        self.artists[artist_id] = artist
-        return artist
+        return self._get_persisted("artist", artist_id, self.session.parse_artist)
 
     def get_album(self, album_id: str) -> Album:
-        """Get an album from cache or fetch from TIDAL API if not cached.
+        """Get an album from cache, the metadata store or the TIDAL API.
 
         Args:
             album_id (str): The TIDAL album ID
@@ -56,14 +486,10 @@ class HTCache:
         Returns:
             Album: The album object from TIDAL API
         """
-        if album_id in self.albums:
-            return self.albums[album_id]
-        album = Album(self.session, album_id)
-        self.albums[album_id] = album
-        return album
+        return self._get_persisted("album", album_id, self.session.parse_album)
 
     def get_track(self, track_id: str) -> Track:
-        """Get a track from cache or fetch from TIDAL API if not cached.
+        """Get a track from cache, the metadata store or the TIDAL API.
 
         Args:
             track_id (str): The TIDAL track ID
@@ -71,14 +497,10 @@ class HTCache:
         Returns:
             Track: The track object from TIDAL API
         """
-        if track_id in self.tracks:
-            return self.tracks[track_id]
-        track = Track(self.session, track_id)
-        self.tracks[track_id] = track
-        return track
+        return self._get_persisted("track", track_id, self.session.parse_track)
 
     def get_playlist(self, playlist_id: str) -> Playlist:
-        """Get a playlist from cache or fetch from TIDAL API if not cached.
+        """Get a playlist from cache, the metadata store or the TIDAL API.
 
         Args:
             playlist_id (str): The TIDAL playlist ID
@@ -86,11 +508,7 @@ class HTCache:
         Returns:
             Playlist: The playlist object from TIDAL API
         """
-        if playlist_id in self.playlists:
-            return self.playlists[playlist_id]
-        playlist = Playlist(self.session, playlist_id)
-        self.playlists[playlist_id] = playlist
-        return playlist
+        return self._get_persisted("playlist", playlist_id, self.session.parse_playlist)
 
     def get_mix(self, mix_id: str) -> Mix:
         """Get a mix from cache or fetch from TIDAL API if not cached.
@@ -101,8 +519,8 @@ class HTCache:
         Returns:
             Mix: The mix object from TIDAL API
         """
-        if mix_id in self.mixes:
-            return self.mixes[mix_id]
-        mix = Mix(self.session, mix_id)
-        self.mixes[mix_id] = mix
-        return mix
+
+        def _fetch():
+            return Mix(self.session, mix_id)
+
+        return self._get("mix", mix_id, lambda: (_fetch(), time.time()), _fetch)
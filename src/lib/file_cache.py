@@ -0,0 +1,305 @@
+# file_cache.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+
+# Write the index back to disk after this many changes, on top of the
+# save done on application shutdown
+SAVE_EVERY = 64
+
+
+class HTFileCache:
+    """Size-bounded on-disk cache of files, the base of the image and audio
+    caches.
+
+    Files are tracked in an in-memory index ordered from least to most
+    recently used. The index is persisted next to the files so startup only
+    reads one file instead of stat()ing the whole directory, and the least
+    recently used files are deleted whenever the total size exceeds the
+    configured budget.
+    """
+
+    label = "File cache"
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+        self.entries: OrderedDict[str, int] = OrderedDict()
+        self.size = 0
+
+        self._lock = threading.Lock()
+        self._changes = 0
+        self._in_flight: Dict[str, threading.Event] = {}
+
+        self._load_index()
+
+    def _load_index(self) -> None:
+        index_path = os.path.join(self.directory, INDEX_NAME)
+
+        try:
+            with open(index_path, "r") as file:
+                data = json.load(file)
+            if data.get("version") != INDEX_VERSION:
+                raise ValueError(f"Unsupported {self.label.lower()} index version")
+            for name, size in data["entries"]:
+                self.entries[name] = size
+                self.size += size
+        except FileNotFoundError:
+            self._scan_directory()
+        except Exception:
+            logger.exception(f"{self.label} index is corrupted, rebuilding it")
+            self.entries.clear()
+            self.size = 0
+            self._scan_directory()
+
+        logger.info(
+            f"{self.label}: {len(self.entries)} files, {self.size // (1024 * 1024)} MB"
+        )
+
+    def _scan_directory(self) -> None:
+        """Build the index from the files already on disk, oldest access first"""
+        files = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.is_file() or entry.name == INDEX_NAME:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # Leftover of an interrupted download
+                    os.remove(entry.path)
+                    continue
+                stat = entry.stat()
+                files.append((stat.st_atime, entry.name, stat.st_size))
+
+        for _atime, name, size in sorted(files):
+            self.entries[name] = size
+            self.size += size
+
+        self._changes += 1
+
+    def path_for(self, name: str) -> str:
+        """Get the path a cached file with the given name is stored at.
+
+        Args:
+            name (str): The file name inside the cache directory
+
+        Returns:
+            str: The absolute path of the file
+        """
+        return os.path.join(self.directory, name)
+
+    def lookup(self, name: str) -> str | None:
+        """Get the path of a cached file and mark it as recently used.
+
+        Args:
+            name (str): The file name inside the cache directory
+
+        Returns:
+            str: The path of the cached file, or None if it is not cached
+        """
+        with self._lock:
+            if name not in self.entries:
+                return None
+            self.entries.move_to_end(name)
+            self._changes += 1
+        return self.path_for(name)
+
+    def discard(self, name: str) -> None:
+        """Forget a cached file and remove it, so it is downloaded again.
+
+        Used by readers that find a cached file missing, for example removed
+        by a cache cleaner, or that cannot decode it. lookup() does not check
+        the file itself, so a hit stays a single index lookup.
+
+        Args:
+            name (str): The file name inside the cache directory
+        """
+        with self._lock:
+            size = self.entries.pop(name, None)
+            if size is None:
+                return
+            self.size -= size
+            self._changes += 1
+
+        logger.warning(f"Dropping {name} from the {self.label}")
+        try:
+            os.remove(self.path_for(name))
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.exception(f"Could not remove {name} from the {self.label}")
+
+    def fetch(self, name: str, download: Callable[[], bytes | None]) -> str | None:
+        """Get the path of a cached file, downloading it if it is missing.
+
+        Concurrent calls for the same name share a single download: the first
+        caller runs it while the others wait for it to finish.
+
+        Args:
+            name (str): The file name inside the cache directory
+            download: A function returning the file content, or None if it
+                could not be retrieved
+
+        Returns:
+            str: The path of the cached file, or None if the download failed
+        """
+        path = self.lookup(name)
+        if path is not None:
+            return path
+
+        with self._lock:
+            if name in self.entries:
+                # Stored by another caller in the meantime
+                return self.path_for(name)
+
+            event = self._in_flight.get(name)
+            is_leader = event is None
+            if is_leader:
+                event = threading.Event()
+                self._in_flight[name] = event
+
+        if not is_leader:
+            event.wait()
+            return self.lookup(name)
+
+        try:
+            data = download()
+            if data is None:
+                return None
+            return self.store(name, data)
+        finally:
+            with self._lock:
+                del self._in_flight[name]
+            event.set()
+
+    def store(self, name: str, data: bytes) -> str:
+        """Write a file into the cache, evicting old files if over budget.
+
+        The file is written to a temporary file first and then renamed, so
+        readers never see a partially written file.
+
+        Args:
+            name (str): The file name inside the cache directory
+            data (bytes): The file content
+
+        Returns:
+            str: The path of the stored file
+        """
+        tmp_path = self.tmp_path_for(name)
+
+        try:
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            return self.add_file(name, tmp_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def tmp_path_for(self, name: str) -> str:
+        """Get a temporary path to write a file to before adding it.
+
+        Args:
+            name (str): The file name inside the cache directory
+
+        Returns:
+            str: A path unique to the calling thread
+        """
+        return f"{self.path_for(name)}.{threading.get_ident()}.tmp"
+
+    def add_file(self, name: str, tmp_path: str) -> str:
+        """Move a completely written file into the cache.
+
+        Args:
+            name (str): The file name inside the cache directory
+            tmp_path (str): The path of the written file, from tmp_path_for()
+
+        Returns:
+            str: The path of the stored file
+        """
+        path = self.path_for(name)
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.size -= self.entries.pop(name, 0)
+            self.entries[name] = size
+            self.size += size
+            self._changes += 1
+            self._evict()
+            should_save = self._changes >= SAVE_EVERY
+
+        if should_save:
+            self.save_index()
+
+        return path
+
+    def set_max_size(self, max_size: int) -> None:
+        """Change the cache budget, evicting files if needed.
+
+        Args:
+            max_size (int): The maximum total size of the cache in bytes
+        """
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self.size > self.max_size and self.entries:
+            name, size = self.entries.popitem(last=False)
+            self.size -= size
+            self._changes += 1
+            try:
+                os.remove(self.path_for(name))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.exception(f"Could not remove {name} from the {self.label}")
+
+    def save_index(self) -> None:
+        """Persist the index if it changed since the last save"""
+        with self._lock:
+            if self._changes == 0:
+                return
+            data = {
+                "version": INDEX_VERSION,
+                "entries": [[name, size] for name, size in self.entries.items()],
+            }
+            self._changes = 0
+
+        index_path = os.path.join(self.directory, INDEX_NAME)
+        tmp_path = f"{index_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.replace(tmp_path, index_path)
+        except OSError:
+            logger.exception(f"Could not save the {self.label.lower()} index")
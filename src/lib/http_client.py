@@ -0,0 +1,129 @@
+# http_client.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import threading
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class HTHttpClient:
+    """Process-wide keep-alive HTTP client used for artwork downloads.
+
+    All requests share one requests.Session whose adapter keeps a bounded
+    pool of connections per host, so covers coming from the same CDN reuse
+    already open TLS connections instead of doing a new handshake each.
+    Transient failures are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        max_hosts: int = 4,
+        max_connections_per_host: int = 8,
+        timeout: tuple[float, float] = (5.0, 20.0),
+        retries: int = 3,
+    ) -> None:
+        self.timeout = timeout
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+
+        # pool_block makes extra threads wait for a free connection instead
+        # of opening throwaway ones past max_connections_per_host
+        self.adapter = HTTPAdapter(
+            pool_connections=max_hosts,
+            pool_maxsize=max_connections_per_host,
+            pool_block=True,
+            max_retries=retry,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        self._lock = threading.Lock()
+        self._pools: Dict[str, Any] = {}
+        self._bytes = 0
+        self._errors = 0
+
+    def get(self, url: str) -> requests.Response:
+        """Perform a GET request through the shared connection pool.
+
+        Args:
+            url (str): The URL to fetch
+
+        Returns:
+            requests.Response: The response, with its content already read
+
+        Raises:
+            requests.RequestException: If the request failed after all retries
+        """
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+
+        pool = self.adapter.poolmanager.connection_from_url(url)
+
+        with self._lock:
+            self._pools[url.split("/")[2]] = pool
+            self._bytes += len(response.content)
+
+        return response
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counters about the connection pool usage.
+
+        Returns:
+            dict: "requests" sent, connection "hits" (requests served on a
+                reused connection) and "misses" (new connections opened),
+                "bytes" downloaded and failed requests as "errors"
+        """
+        with self._lock:
+            n_requests = sum(pool.num_requests for pool in self._pools.values())
+            n_connections = sum(
+                pool.num_connections for pool in self._pools.values()
+            )
+            return {
+                "requests": n_requests,
+                "hits": n_requests - n_connections,
+                "misses": n_connections,
+                "bytes": self._bytes,
+                "errors": self._errors,
+            }
+
+    def log_stats(self) -> None:
+        """Log the connection pool counters"""
+        stats = self.get_stats()
+        logger.info(
+            f"HTTP: {stats['requests']} requests, {stats['hits']} reused "
+            f"connections, {stats['misses']} new connections, "
+            f"{stats['bytes'] // 1024} KiB, {stats['errors']} errors"
+        )
@@ -0,0 +1,33 @@
+# image_cache.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from .file_cache import HTFileCache
+
+
+class HTImageCache(HTFileCache):
+    """Size-bounded on-disk cache for cover art and video covers.
+
+    Covers are downloaded with fetch(), which shares a single download
+    between the callers asking for the same file at the same time.
+    """
+
+    label = "Image cache"
+
+    def __init__(self, directory: str, max_size: int = 500 * 1024 * 1024) -> None:
+        super().__init__(directory, max_size)
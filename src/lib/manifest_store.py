@@ -0,0 +1,83 @@
+# manifest_store.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class HTManifestStore:
+    """Directory of DASH manifests, one file per manifest content.
+
+    Every manifest is written to a file named after the hash of its content,
+    through a temporary file and a rename, so the manifest of the next track
+    never overwrites the one dashdemux is still reading for the current
+    track. Only the most recently written manifests are kept.
+    """
+
+    def __init__(self, directory: str, keep: int = 8) -> None:
+        self.directory = directory
+        self.keep = keep
+
+        self.paths: OrderedDict[str, str] = OrderedDict()
+
+        self._lock = threading.Lock()
+
+        # Manifests are only valid for a short time, drop the old ones
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file():
+                    os.remove(entry.path)
+
+    def write(self, data: str) -> str:
+        """Write a manifest if it is not already stored.
+
+        Args:
+            data (str): The MPD manifest
+
+        Returns:
+            str: The path of the manifest file
+        """
+        digest = hashlib.sha1(data.encode()).hexdigest()
+        path = os.path.join(self.directory, f"{digest}.mpd")
+
+        with self._lock:
+            if digest in self.paths:
+                self.paths.move_to_end(digest)
+                return path
+
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.paths[digest] = path
+            while len(self.paths) > self.keep:
+                _digest, old_path = self.paths.popitem(last=False)
+                try:
+                    os.remove(old_path)
+                except OSError:
+                    logger.exception(f"Could not remove {old_path}")
+
+        return path
@@ -0,0 +1,138 @@
+# metadata_store.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long an object is considered fresh, in seconds
+TTLS: Dict[str, int] = {
+    "artist": 7 * 24 * 3600,
+    "album": 30 * 24 * 3600,
+    "track": 30 * 24 * 3600,
+    "playlist": 3600,
+    "mix": 3600,
+}
+
+# Stale objects are still served while they are refreshed in the background,
+# until they are older than this many times their TTL
+MAX_STALE_FACTOR = 4
+
+
+class HTMetadataStore:
+    """Persistent SQLite store for the JSON of TIDAL objects.
+
+    Objects are stored as the raw JSON returned by the API together with
+    the time they were fetched, so they can be parsed back into tidalapi
+    objects on the next start instead of being requested again.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            "type TEXT NOT NULL, "
+            "id TEXT NOT NULL, "
+            "data TEXT NOT NULL, "
+            "fetched REAL NOT NULL, "
+            "PRIMARY KEY (type, id))"
+        )
+        self._connection.commit()
+
+    def get(self, type: str, id: str) -> Tuple[Any, float] | None:
+        """Get the stored JSON of an object and when it was fetched.
+
+        Args:
+            type (str): The object type, like "artist" or "album"
+            id (str): The TIDAL object ID
+
+        Returns:
+            tuple: The decoded JSON object and its fetch time, or None if
+                missing or too old to be served even while refreshing
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, fetched FROM objects WHERE type = ? AND id = ?",
+                (type, str(id)),
+            ).fetchone()
+
+        if row is None or time.time() - row[1] > TTLS[type] * MAX_STALE_FACTOR:
+            return None
+
+        try:
+            return json.loads(row[0]), row[1]
+        except ValueError:
+            logger.warning(f"Corrupted {type} {id} in the metadata store")
+            return None
+
+    def put(self, type: str, id: str, data: Any) -> None:
+        """Store the JSON of an object.
+
+        Args:
+            type (str): The object type, like "artist" or "album"
+            id (str): The TIDAL object ID
+            data: The JSON object returned by the API
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO objects (type, id, data, fetched) "
+                "VALUES (?, ?, ?, ?)",
+                (type, str(id), json.dumps(data, separators=(",", ":")), time.time()),
+            )
+            self._connection.commit()
+
+    def delete(self, type: str, id: str) -> None:
+        """Remove an object from the store.
+
+        Args:
+            type (str): The object type, like "artist" or "album"
+            id (str): The TIDAL object ID
+        """
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM objects WHERE type = ? AND id = ?", (type, str(id))
+            )
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove every stored object"""
+        with self._lock:
+            self._connection.execute("DELETE FROM objects")
+            self._connection.commit()
+
+    def prune(self) -> None:
+        """Remove the objects that are too old to be served anymore"""
+        now = time.time()
+        with self._lock:
+            for type, ttl in TTLS.items():
+                self._connection.execute(
+                    "DELETE FROM objects WHERE type = ? AND fetched < ?",
+                    (type, now - ttl * MAX_STALE_FACTOR),
+                )
+            self._connection.commit()
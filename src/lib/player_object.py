@@ -22,17 +22,24 @@ import random
 import threading
 from enum import IntEnum
 from gettext import gettext as _
-from pathlib import Path
-from typing import Any, List, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 from gi.repository import GLib, GObject, Gst
 from tidalapi import Album, Artist, Mix, Playlist, Track
 from tidalapi.media import ManifestMimeType
 
 from . import discord_rpc, utils
+from .stream_prefetcher import HTStreamPrefetcher
 
 logger = logging.getLogger(__name__)
 
+# Number of upcoming tracks whose stream is resolved ahead of time
+PREFETCH_DEPTH = 2
+
+# The position is queried from the pipeline at most this often, in
+# microseconds, and extrapolated from the monotonic clock in between
+POSITION_RESYNC_INTERVAL = 2_000_000
+
 
 class RepeatType(IntEnum):
     NONE = 0
@@ -49,6 +56,297 @@ class AudioSink(IntEnum):
     PIPEWIRE = 5
 
 
+# Tracks of playlists and albums are fetched in pages of this size
+PAGE_SIZE = 100
+# Number of upcoming tracks kept fetched ahead of the play position
+LOOKAHEAD = 50
+
+
+class PlayQueue:
+    """Tracks of the playing context with an O(1) play position.
+
+    The tracks are kept once in their original order, together with a map
+    from track id to index. The play order is the original order rotated to
+    start from the first played track, or a permutation of the indices when
+    shuffled, so moving to the next track or shuffling never copies the
+    Track objects.
+
+    With a fetch_page function the context can be lazy: missing tracks are
+    None and their pages are fetched in the background ahead of the play
+    position. If playback reaches a track first, it is resolved on the track
+    loader thread, which waits for the page already being fetched instead of
+    fetching it again. Each page is fetched at most once, and the slots that
+    stay empty, because the fetch failed or num_tracks was stale, are skipped
+    like unavailable tracks.
+    """
+
+    def __init__(
+        self,
+        tracks: List[Track | None] | None = None,
+        start: int = 0,
+        fetch_page: Callable[[int], List[Track]] | None = None,
+    ) -> None:
+        """Create a play queue.
+
+        Args:
+            tracks: The tracks of the context, None for the ones not fetched yet
+            start (int): The index of the first track to play
+            fetch_page: Optional function returning the PAGE_SIZE tracks
+                starting at the given offset
+        """
+        self.tracks: List[Track | None] = tracks or []
+        self.start = start
+        self.fetch_page = fetch_page
+
+        self.index_map: Dict[Any, int] = {}
+        for index, track in enumerate(self.tracks):
+            if track is not None:
+                self.index_map.setdefault(track.id, index)
+
+        # Permutation of the indices when shuffled
+        self.order: List[int] | None = None
+        # Position in the play order of the current track
+        self.position = -1
+        # Bumped on every change of the upcoming tracks other than a move of
+        # the position, so views can follow moves without a full diff
+        self.version = 0
+
+        self._loading_pages: set[int] = set()
+        # Pages fetched once, successfully or not
+        self._fetched_pages: set[int] = set()
+        self._lock = threading.Lock()
+        self._page_fetched = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def _index_at(self, position: int) -> int:
+        if self.order is not None:
+            return self.order[position]
+        return (self.start + position) % len(self.tracks)
+
+    def load_page(self, page: int) -> None:
+        """Fetch the tracks of a page of a lazy context.
+
+        Args:
+            page (int): The page number, the offset divided by PAGE_SIZE
+        """
+        offset = page * PAGE_SIZE
+        try:
+            tracks = self.fetch_page(offset)
+        except Exception:
+            logger.exception(f"Could not fetch the tracks at {offset}")
+            tracks = []
+
+        with self._lock:
+            for index, track in enumerate(tracks[:PAGE_SIZE], offset):
+                if index < len(self.tracks) and self.tracks[index] is None:
+                    self.tracks[index] = track
+                    self.index_map.setdefault(track.id, index)
+                    self.version += 1
+            self._loading_pages.discard(page)
+            self._fetched_pages.add(page)
+            self._page_fetched.notify_all()
+
+    def _load_ahead(self) -> None:
+        """Fetch in the background the pages of the next LOOKAHEAD tracks"""
+        if self.fetch_page is None:
+            return
+
+        pages = []
+        with self._lock:
+            end = min(len(self.tracks), self.position + 1 + LOOKAHEAD)
+            for position in range(self.position + 1, end):
+                index = self._index_at(position)
+                page = index // PAGE_SIZE
+                if (
+                    self.tracks[index] is None
+                    and page not in self._loading_pages
+                    and page not in self._fetched_pages
+                ):
+                    self._loading_pages.add(page)
+                    pages.append(page)
+
+        def _load_pages():
+            for page in pages:
+                self.load_page(page)
+
+        if pages:
+            threading.Thread(target=_load_pages, daemon=True).start()
+
+    def track_at(self, index: int) -> Track | None:
+        """Get the track at an index of the original order, fetching it if needed.
+
+        If its page is already being fetched, this waits for it. This blocks,
+        so it must not be called from the main loop.
+
+        Args:
+            index (int): The index of the track
+
+        Returns:
+            Track: The track, or None if it could not be fetched
+        """
+        if self.fetch_page is None:
+            return self.tracks[index]
+
+        page = index // PAGE_SIZE
+        with self._lock:
+            while page in self._loading_pages:
+                self._page_fetched.wait()
+            if self.tracks[index] is not None or page in self._fetched_pages:
+                return self.tracks[index]
+            self._loading_pages.add(page)
+
+        self.load_page(page)
+        return self.tracks[index]
+
+    def current(self) -> Track | None:
+        """Get the track at the current position, without fetching it.
+
+        Returns:
+            Track: The current track, or None before the first one or if it
+                is not fetched yet
+        """
+        if self.position < 0:
+            return None
+        return self.tracks[self._index_at(self.position)]
+
+    def resolve_current(self) -> Track | None:
+        """Get the track at the current position, fetching it if needed.
+
+        Empty slots and unavailable tracks are skipped by moving the position
+        forward. This blocks like track_at(), so it must not be called from
+        the main loop.
+
+        Returns:
+            Track: The first playable track from the current position, or None
+                if there is none before the end
+        """
+        while True:
+            with self._lock:
+                position = self.position
+                if not 0 <= position < len(self.tracks):
+                    return None
+                index = self._index_at(position)
+
+            track = self.track_at(index)
+            if track is not None and track.available:
+                return track
+
+            with self._lock:
+                # Moved in the meantime, resolve the new position instead
+                if self.position != position:
+                    continue
+                if not self.has_next():
+                    return None
+                self.position += 1
+            self._load_ahead()
+
+    def index_of(self, track: Track) -> int:
+        """Get the index of a track in the original order.
+
+        Args:
+            track: The track to look up
+
+        Returns:
+            int: The index of the track, or -1 if it is not in the context
+        """
+        if self.position >= 0 and track is self.current():
+            return self._index_at(self.position)
+        return self.index_map.get(track.id, -1)
+
+    def has_next(self) -> bool:
+        return self.position + 1 < len(self.tracks)
+
+    def next(self) -> Track | None:
+        """Move to the next track, without fetching it.
+
+        The track may be missing or unavailable, resolve_current() returns
+        the first playable one from the new position.
+
+        Returns:
+            Track: The next track, or None if the end was reached or it is not
+                fetched yet
+        """
+        with self._lock:
+            if not self.has_next():
+                return None
+            self.position += 1
+        self._load_ahead()
+        return self.current()
+
+    def previous(self) -> None:
+        """Move back one track, so the current one becomes the next one"""
+        with self._lock:
+            if self.position >= 0:
+                self.position -= 1
+
+    def upcoming(self, count: int | None = None) -> List[Track]:
+        """Get the fetched tracks after the current position.
+
+        Args:
+            count (int): The maximum number of positions, all of them if None
+
+        Returns:
+            list: The upcoming tracks in play order
+        """
+        end = len(self.tracks)
+        if count is not None:
+            end = min(end, self.position + 1 + count)
+        return self.fetched_between(self.position + 1, end)
+
+    def fetched_between(self, first: int, end: int) -> List[Track]:
+        """Get the fetched tracks at a range of positions of the play order.
+
+        Args:
+            first (int): The first position
+            end (int): The position after the last one
+
+        Returns:
+            list: The fetched tracks in play order
+        """
+        tracks = (
+            self.tracks[self._index_at(position)]
+            for position in range(max(first, 0), min(end, len(self.tracks)))
+        )
+        return [track for track in tracks if track is not None]
+
+    def restart(self) -> None:
+        """Go back to before the first track, reshuffling if shuffled"""
+        with self._lock:
+            self.position = -1
+        if self.order is not None:
+            random.shuffle(self.order)
+            self.version += 1
+        self._load_ahead()
+
+    def set_shuffle(self, shuffle: bool) -> None:
+        """Shuffle or restore the order of the upcoming tracks.
+
+        Args:
+            shuffle (bool): Whether the upcoming tracks should be shuffled
+        """
+        if not self.tracks or shuffle == (self.order is not None):
+            return
+
+        if shuffle:
+            order = [
+                self._index_at(position) for position in range(len(self.tracks))
+            ]
+            upcoming = order[self.position + 1 :]
+            random.shuffle(upcoming)
+            order[self.position + 1 :] = upcoming
+            self.order = order
+        else:
+            # Continue in the original order after the current track
+            if self.position >= 0:
+                self.start = self._index_at(self.position) - self.position
+            self.order = None
+
+        self.version += 1
+        self._load_ahead()
+
+
 class PlayerObject(GObject.GObject):
     """Handles player logic, queue, and shuffle functionality."""
 
@@ -91,11 +389,13 @@ class PlayerObject(GObject.GObject):
             self.playbin = Gst.ElementFactory.make("playbin", "playbin")
             self.gapless_enabled = False
 
-        if preferred_sink == AudioSink.PIPEWIRE:
-            self.gapless_enabled = False
-
         self.use_about_to_finish = True
 
+        # The stream volume can also be changed outside the app, for example
+        # in the PipeWire or PulseAudio mixer, and playbin follows it
+        self._volume: float | None = None
+        self.playbin.connect("notify::volume", self._on_volume_notify)
+
         self.pipeline.add(self.playbin)
 
         self.normalize = normalize
@@ -115,32 +415,51 @@ class PlayerObject(GObject.GObject):
         self._bus.connect("message::error", self._on_bus_error)
         self._bus.connect("message::buffering", self._on_buffering_message)
         self._bus.connect("message::stream-start", self._on_track_start)
+        self._bus.connect("message::clock-lost", self._on_clock_lost)
 
         # Initialize state utils
         self._shuffle = False
         self._playing = False
         self._repeat_type = RepeatType.NONE
 
-        self.id_list: List[str] = []
-
         self.queue: List[Track] = []
         self.current_mix_album_playlist: Union[Mix, Album, Playlist] | None = None
-        self._tracks_to_play: List[Track] = []
-        self.tracks_to_play: List[Track] = []
-        self._shuffled_tracks_to_play: List[Track] = []
+        self.play_queue = PlayQueue()
         self.played_songs: List[Track] = []
+        # Bumped on every change of played_songs and queue other than
+        # play_next() moving a track from the queue to the played songs
+        self.history_version = 0
         self.playing_track: Track | None = None
         self.song_album: Album | None = None
         self.duration = self.query_duration()
         self.manifest: Any | None = None
         self.stream: Any | None = None
         self.update_timer: Any | None = None
-        self.seek_after_sink_reload: int | None = None
+        # Milliseconds between update-slider emissions, 0 stops them
+        self.update_interval = 1000
+        # Last position queried from the pipeline and its monotonic time
+        self._position_snapshot: Tuple[int, int] | None = None
         self.seeked_to_end = False
 
         # next track variables for gapless
         self.next_track: Any | None = None
 
+        self.prefetcher = HTStreamPrefetcher(self._prefetch_stream)
+        self._play_this_generation = 0
+
+        # Tracks are loaded one at a time on a single thread, and a newer
+        # request supersedes the pending and the loading ones. A request
+        # holds a function returning the track, so tracks of the play queue
+        # that are not fetched yet are resolved on that thread too
+        self._load_condition = threading.Condition()
+        self._load_request: (
+            Tuple[int, Callable[[], Track | None], bool] | None
+        ) = None
+        self._load_generation = 0
+        threading.Thread(
+            target=self._track_loader, name="track-loader", daemon=True
+        ).start()
+
     @GObject.Property(type=bool, default=False)
     def playing(self) -> bool:
         return self._playing
@@ -161,7 +480,8 @@ class PlayerObject(GObject.GObject):
 
         self._shuffle = _shuffle
         self.notify("shuffle")
-        self._update_shuffle_queue()
+        self.play_queue.set_shuffle(_shuffle)
+        self._prefetch_next()
         # self.emit("song-changed")
 
     @GObject.Property(type=int, default=0)
@@ -172,9 +492,40 @@ class PlayerObject(GObject.GObject):
     def repeat_type(self, _repeat_type: RepeatType) -> None:
         self._repeat_type = _repeat_type
         self.notify("repeat-type")
+        self._prefetch_next()
 
     def _setup_audio_sink(self, sink_type: AudioSink) -> None:
-        """Configure the audio sink using parse_launch for simplicity."""
+        """Build the audio output bin used for the whole session.
+
+        The bin is never rebuilt, the sink and the normalization elements
+        are swapped inside it with _swap_element instead.
+        """
+        self.audio_bin = Gst.Bin.new("audio-output")
+
+        queue = Gst.ElementFactory.make("queue", None)
+        self._audio_convert = Gst.ElementFactory.make("audioconvert", None)
+        self._audio_resample = Gst.ElementFactory.make("audioresample", None)
+        self._normalization = self._make_normalization() if self.normalize else None
+        self._audio_sink: Gst.Element | None = None
+
+        elements = [
+            queue,
+            self._audio_convert,
+            self._normalization,
+            self._audio_resample,
+        ]
+        elements = [element for element in elements if element]
+        for element in elements:
+            self.audio_bin.add(element)
+        for upstream, downstream in zip(elements, elements[1:]):
+            upstream.link(downstream)
+
+        self.audio_bin.add_pad(Gst.GhostPad.new("sink", queue.get_static_pad("sink")))
+        self.playbin.set_property("audio-sink", self.audio_bin)
+
+        self.change_audio_sink(sink_type)
+
+    def _make_sink(self, sink_type: AudioSink) -> Gst.Element:
         sink_map = {
             AudioSink.AUTO: "autoaudiosink",
             AudioSink.PULSE: "pulsesink",
@@ -184,38 +535,104 @@ class PlayerObject(GObject.GObject):
             AudioSink.PIPEWIRE: "pipewiresink",
         }
 
-        sink_name = sink_map.get(sink_type, "autoaudiosink")
+        try:
+            sink = Gst.parse_launch(sink_map.get(sink_type, "autoaudiosink"))
+            if not sink:
+                raise RuntimeError("Failed to create audio sink")
+            return sink
+        except (GLib.Error, RuntimeError):
+            logger.exception("Error creating audio sink")
+            return Gst.ElementFactory.make("autoaudiosink", None)
+
+    def _make_normalization(self) -> Gst.Element:
+        # the pre-amp value is set to match tidal webs volume
+        return Gst.parse_bin_from_description(
+            f"taginject name=rgtags {self.most_recent_rg_tags} ! "
+            "rgvolume name=rgvol pre-amp=4.0 fallback-gain=-10 headroom=6.0 ! "
+            "rglimiter ! audioconvert",
+            True,
+        )
 
-        # add normalization to pipeline if set by settings
-        normalization = ""
-        if self.normalize:
-            # the pre-amp value is set to match tidal webs volume
-            normalization = (
-                f"taginject name=rgtags {self.most_recent_rg_tags} ! "
-                f"rgvolume name=rgvol pre-amp=4.0 fallback-gain=-10 headroom=6.0 ! "
-                f"rglimiter ! audioconvert !"
-            )
+    def _swap_element(
+        self,
+        upstream: Gst.Element,
+        old: Gst.Element | None,
+        new: Gst.Element | None,
+        downstream: Gst.Element | None,
+    ) -> None:
+        """Replace an element of the audio bin without stopping the pipeline.
 
-        pipeline_str = (
-            f"queue ! audioconvert ! {normalization} audioresample ! {sink_name}"
-        )
+        While playing, the source pad of upstream is blocked and the swap is
+        done from the main loop, then the pad is unblocked. The sticky events
+        (caps, segment, tags) are sent again to the new element with the next
+        buffer, so playback continues from the same position.
 
-        if sink_type == AudioSink.PIPEWIRE:
-            self.gapless_enabled = False
-        else:
-            self.gapless_enabled = True
+        Otherwise no buffer is flowing, a paused sink even holds the
+        streaming thread until it resumes, so the elements are swapped right
+        away and a paused pipeline is prerolled again into the new element
+        with a flushing seek to the same position.
 
-        try:
-            audio_bin = Gst.parse_bin_from_description(pipeline_str, True)
-            if not audio_bin:
-                raise RuntimeError("Failed to create audio bin")
-
-            self.playbin.set_property("audio-sink", audio_bin)
-        except GLib.Error:
-            logger.exception("Error creating pipeline")
-            self.playbin.set_property(
-                "audio-sink", Gst.ElementFactory.make("autoaudiosink", None)
-            )
+        Args:
+            upstream: The element before the swapped one
+            old: The element to remove, or None to insert new
+            new: The element to add, or None to link upstream and
+                downstream directly
+            downstream: The element after the swapped one, None for the sink
+        """
+        _ret, state, _pending = self.pipeline.get_state(0)
+        if state != Gst.State.PLAYING:
+            position = self.query_position(None)
+            self._relink(upstream, old, new, downstream)
+            if state == Gst.State.PAUSED and position is not None:
+                self.playbin.seek_simple(
+                    Gst.Format.TIME,
+                    Gst.SeekFlags.FLUSH | Gst.SeekFlags.ACCURATE,
+                    position,
+                )
+            return
+
+        pad = upstream.get_static_pad("src")
+        blocked = threading.Event()
+
+        def _swap(probe_id: int) -> bool:
+            self._relink(upstream, old, new, downstream)
+            pad.remove_probe(probe_id)
+            return GLib.SOURCE_REMOVE
+
+        def _on_blocked(pad: Gst.Pad, info: Gst.PadProbeInfo) -> Gst.PadProbeReturn:
+            # The streaming thread waits here until the main loop swapped
+            if not blocked.is_set():
+                blocked.set()
+                GLib.idle_add(_swap, info.id)
+            return Gst.PadProbeReturn.OK
+
+        pad.add_probe(Gst.PadProbeType.BLOCK_DOWNSTREAM, _on_blocked)
+
+    def _relink(
+        self,
+        upstream: Gst.Element,
+        old: Gst.Element | None,
+        new: Gst.Element | None,
+        downstream: Gst.Element | None,
+    ) -> None:
+        """Link new in place of old, see _swap_element, on the main loop"""
+        if old:
+            upstream.unlink(old)
+            if downstream:
+                old.unlink(downstream)
+            old.set_state(Gst.State.NULL)
+            self.audio_bin.remove(old)
+        elif downstream:
+            upstream.unlink(downstream)
+
+        if new:
+            self.audio_bin.add(new)
+            upstream.link(new)
+            if downstream:
+                new.link(downstream)
+            new.sync_state_with_parent()
+        else:
+            upstream.link(downstream)
 
     def change_audio_sink(self, sink_type: AudioSink) -> None:
         """Change the audio sink while maintaining playback state.
@@ -223,24 +640,50 @@ class PlayerObject(GObject.GObject):
         Args:
             sink_type (int): The audio sink `AudioSink` enum
         """
-        self.use_about_to_finish = False
-        # Play the same track again after reload
-        self.next_track = self.playing_track
-        was_playing: bool = self.playing
-        position: int = self.query_position()
-        duration: int = self.query_duration()
+        old_sink = self._audio_sink
+        self._audio_sink = self._make_sink(sink_type)
+        self.sink_type = sink_type
+
+        self._swap_element(self._audio_resample, old_sink, self._audio_sink, None)
+
+    def change_alsa_device(self, device: str) -> None:
+        """Change the ALSA output device.
+
+        Args:
+            device (str): The ALSA device, like "hw:0,0"
+        """
+        self.alsa_device = device
+        if self.sink_type == AudioSink.ALSA:
+            self.change_audio_sink(AudioSink.ALSA)
 
-        self.pipeline.set_state(Gst.State.NULL)
-        self._setup_audio_sink(sink_type)
+    def change_normalization(self, normalize: bool) -> None:
+        """Insert or bypass the ReplayGain elements without stopping playback.
 
-        if was_playing and duration != 0:
+        Args:
+            normalize (bool): Whether to apply ReplayGain normalization
+        """
+        if self.normalize == normalize:
+            return
+        self.normalize = normalize
+
+        old_normalization = self._normalization
+        self._normalization = self._make_normalization() if normalize else None
+        self._swap_element(
+            self._audio_convert,
+            old_normalization,
+            self._normalization,
+            self._audio_resample,
+        )
+
+    def _on_clock_lost(self, *args) -> None:
+        """Select a new clock after the sink providing it was swapped."""
+        if self.playing:
+            self.pipeline.set_state(Gst.State.PAUSED)
             self.pipeline.set_state(Gst.State.PLAYING)
-            self.seek_after_sink_reload = position / duration
-        self.use_about_to_finish = True
 
     def _on_bus_eos(self, *args) -> None:
         """Handle end of stream."""
-        if not self.tracks_to_play or not self.queue:
+        if not self.play_queue.has_next() or not self.queue:
             self.pause()
         if not self.gapless_enabled:
             GLib.idle_add(self.play_next)
@@ -288,7 +731,7 @@ class PlayerObject(GObject.GObject):
             self.playing_track = self.next_track
             self.next_track = None
         self.song_album = self.playing_track.album
-        self.can_go_next = len(self._tracks_to_play) > 0
+        self.can_go_next = self.play_queue.has_next()
         self.can_go_prev = len(self.played_songs) > 0
         self.duration = self.query_duration()
         # Should only trigger when track is enqued on start without playback
@@ -315,14 +758,10 @@ class PlayerObject(GObject.GObject):
         if self.discord_rpc_enabled and self.playing_track:
             discord_rpc.set_activity(self.playing_track, 0)
 
-        if self.update_timer:
-            GLib.source_remove(self.update_timer)
-        self.update_timer = GLib.timeout_add(1000, self._update_slider_callback)
+        self._sync_position()
+        self._schedule_update()
 
         self.seeked_to_end = False
-        if self.seek_after_sink_reload:
-            self.seek(self.seek_after_sink_reload)
-            self.seek_after_sink_reload = None
 
         self.can_go_prev = len(self.played_songs) > 0
         # Only notify to deactivate
@@ -330,52 +769,160 @@ class PlayerObject(GObject.GObject):
             self.notify("can-go-prev")
             GLib.timeout_add(2000, self.previous_timer_callback)
 
+        self._prefetch_next()
+
+    def get_upcoming(self, count: int = PREFETCH_DEPTH) -> List[Track]:
+        """Get the tracks that will be played after the current one.
+
+        Args:
+            count (int): The maximum number of tracks to return
+
+        Returns:
+            list: The upcoming tracks, in the order they will be played
+        """
+        if self._repeat_type == RepeatType.SONG:
+            return []
+
+        upcoming = self.queue[:count]
+        if len(upcoming) < count:
+            upcoming += self.play_queue.upcoming(count - len(upcoming))
+        return upcoming
+
+    def _prefetch_next(self) -> None:
+        self.prefetcher.prefetch(self.get_upcoming())
+
+    def invalidate_prefetch(self) -> None:
+        """Drop the prefetched streams, for example after a quality change"""
+        self.prefetcher.invalidate()
+        self._prefetch_next()
+
     def play_this(
-        self, thing: Union[Mix, Album, Playlist, List[Track], Track], index: int = 0
+        self,
+        thing: Union[Mix, Album, Playlist, List[Track], Track],
+        index: int | None = 0,
+        tracks: List[Track] | None = None,
     ) -> None:
         """Play tracks from a mix, album, playlist, or artist.
 
+        If the chosen track is among the already loaded tracks, or the track
+        is picked at random, it starts loading right away and the rest of the
+        context is fetched in the background. Otherwise the context is
+        resolved on a thread first.
+
         Args:
             thing: An object (Mix, Album, Playlist, Artist, or list of Tracks) to play
-            index (int): The index of the track to start playing (default: 0)
+            index (int): The index of the track to start playing, or None for
+                a random one (default: 0)
+            tracks: The tracks of the context that are already loaded, from
+                the first one, like the ones shown on a page
         """
         self.current_mix_album_playlist = thing
-        tracks: List[Track] = self.get_track_list(thing)
+        # Will result in play() call later
+        self.playing = True
 
-        if not tracks:
-            logger.info("No tracks found to play")
+        self._play_this_generation += 1
+        generation = self._play_this_generation
+
+        if tracks is None and isinstance(thing, list):
+            tracks = thing
+
+        if tracks and (index is None or index < len(tracks)):
+            play_queue = self._make_play_queue(thing, tracks)
+            if index is None:
+                # Pick from the whole album or playlist, not only the loaded
+                # tracks, the lazy play queue fetches the page of the pick
+                index = random.randrange(len(play_queue))
+            self._start_play_queue(play_queue, index, generation)
             return
 
-        self._tracks_to_play = tracks[index:] + tracks[:index]
-        if not self._tracks_to_play:
+        def _resolve():
+            try:
+                play_queue = self._make_play_queue(thing, tracks)
+            except Exception:
+                logger.exception("Error getting the tracks to play")
+                return
+            start = index
+            if start is None and play_queue:
+                start = random.randrange(len(play_queue))
+            GLib.idle_add(self._start_play_queue, play_queue, start, generation)
+
+        threading.Thread(target=_resolve, daemon=True).start()
+
+    def _start_play_queue(
+        self, play_queue: PlayQueue, start: int | None, generation: int
+    ) -> None:
+        """Replace the play queue and play from a track.
+
+        The track is resolved on the track loader thread, which skips to the
+        next available one if it cannot be played.
+
+        Args:
+            play_queue (PlayQueue): The play queue of the context
+            start (int): The index of the chosen track
+            generation (int): The play_this() call number, to ignore old calls
+        """
+        if generation != self._play_this_generation:
             return
 
-        track: Track = self._tracks_to_play.pop(0)
+        if not play_queue or start is None:
+            logger.info("No tracks found to play")
+            return
 
-        if not track.available:
-            self.play_this(thing, index+1)
-        else:
-            self.tracks_to_play = self._tracks_to_play
-            self.played_songs = []
+        play_queue.start = start % len(play_queue)
+        self.play_queue = play_queue
+        self.play_queue.next()
+        self.played_songs = []
+        self.history_version += 1
 
-            if self.shuffle:
-                self._update_shuffle_queue()
+        if self.shuffle:
+            self.play_queue.set_shuffle(True)
 
-            # Will result in play() call later
-            self.playing = True
-            self.play_track(track)
+        self._play_current()
 
     def shuffle_this(
-        self, thing: Union[Mix, Album, Playlist, List[Track], Track]
+        self,
+        thing: Union[Mix, Album, Playlist, List[Track], Track],
+        tracks: List[Track] | None = None,
     ) -> None:
-        """Same as play_this, but enables shuffle mode.
+        """Same as play_this, but starts from a random track in shuffle mode.
 
         Args:
             thing: An object (Mix, Album, Playlist, Artist, or list of Tracks) to play
+            tracks: The tracks of the context that are already loaded
         """
-        tracks: List[Track] = self.get_track_list(thing)
-        self.play_this(thing, random.randint(0, len(tracks)))
         self.shuffle = True
+        self.play_this(thing, None, tracks)
+
+    def _make_play_queue(
+        self,
+        thing: Union[Mix, Album, Playlist, Artist, List[Track], Track],
+        tracks: List[Track] | None = None,
+    ) -> PlayQueue:
+        """Create the play queue of a context.
+
+        Playlists and albums are fetched lazily one page at a time, starting
+        with the already loaded tracks.
+
+        Args:
+            thing: A TIDAL object (Mix, Album, Playlist, Artist, or list of Tracks)
+            tracks: The tracks of the context that are already loaded
+
+        Returns:
+            PlayQueue: The play queue, empty if the context has no tracks
+        """
+        if isinstance(thing, (Album, Playlist)) and thing.num_tracks > 0:
+
+            def _fetch_page(offset):
+                return thing.tracks(limit=PAGE_SIZE, offset=offset)
+
+            known = list(tracks or [])[: thing.num_tracks]
+            known += [None] * (thing.num_tracks - len(known))
+            return PlayQueue(known, fetch_page=_fetch_page)
+
+        if tracks:
+            return PlayQueue(list(tracks))
+
+        return PlayQueue(self.get_track_list(thing))
 
     def get_track_list(
         self, thing: Union[Mix, Album, Playlist, Artist, List[Track], Track]
@@ -403,8 +950,6 @@ class PlayerObject(GObject.GObject):
         elif isinstance(thing, Track):
             tracks_list = [thing]
 
-        self.id_list = [track.id for track in tracks_list]
-
         return tracks_list
 
     def play(self) -> None:
@@ -416,14 +961,14 @@ class PlayerObject(GObject.GObject):
             discord_rpc.set_activity(
                 self.playing_track, self.query_position() / 1_000_000
             )
-        if self.update_timer:
-            GLib.source_remove(self.update_timer)
-        self.update_timer = GLib.timeout_add(1000, self._update_slider_callback)
+        self._sync_position()
+        self._schedule_update()
 
     def pause(self) -> None:
         """Pause playback of the current track."""
         self.playing = False
         self.pipeline.set_state(Gst.State.PAUSED)
+        self._sync_position()
 
         if self.discord_rpc_enabled:
             discord_rpc.set_activity()
@@ -442,46 +987,132 @@ class PlayerObject(GObject.GObject):
             track: The Track object to play
             gapless: Whether to enqueue the track for gapless playback
         """
-        threading.Thread(target=self._play_track_thread, args=(track, gapless)).start()
+        self._request_load(lambda: track, gapless)
 
-    def _play_track_thread(self, track: Track, gapless=False) -> None:
-        """Thread for loading and playing a track.
+    def _play_current(self, gapless=False) -> None:
+        """Play the current track of the play queue.
 
         Args:
-            track: The Track object to play
             gapless: Whether to enqueue the track for gapless playback
         """
+        self._request_load(self.play_queue.resolve_current, gapless)
 
-        self.stream = None
-        self.manifest = None
+    def _request_load(self, get_track: Callable[[], Track | None], gapless) -> None:
+        with self._load_condition:
+            self._load_generation += 1
+            self._load_request = (self._load_generation, get_track, gapless)
+            self._load_condition.notify()
 
-        try:
-            self.stream = track.get_stream()
-            self.manifest = self.stream.get_stream_manifest()
-            urls = self.manifest.get_urls()
+    def _track_loader(self) -> None:
+        while True:
+            with self._load_condition:
+                while self._load_request is None:
+                    self._load_condition.wait()
+                generation, get_track, gapless = self._load_request
+                self._load_request = None
 
-            # When not gapless there is a race condition between get_stream() and on_track_start
-            if not gapless:
-                self.apply_replaygain_tags()
+            track = get_track()
+            if track is None:
+                if not self._is_superseded(generation):
+                    logger.info("No playable tracks left")
+                    GLib.idle_add(self.pause)
+                continue
 
-            if self.stream.manifest_mime_type == ManifestMimeType.MPD:
-                data = self.stream.get_manifest_data()
-                if data:
-                    mpd_path = Path(utils.CACHE_DIR, "manifest.mpd")
-                    with open(mpd_path, "w") as file:
-                        file.write(data)
+            self._load_track(track, gapless, generation)
+
+    def _is_superseded(self, generation: int) -> bool:
+        return generation != self._load_generation
+
+    def _resolve_stream(self, track: Track) -> Tuple[Any, Any]:
+        """Get the stream and the stream manifest of a track from TIDAL.
+
+        Args:
+            track: The Track object to resolve
+
+        Returns:
+            tuple: The stream, which also holds the ReplayGain data, and the
+                parsed stream manifest
+        """
+        stream = track.get_stream()
+        return stream, stream.get_stream_manifest()
+
+    def _prefetch_stream(self, track: Track) -> Tuple[Any, Any]:
+        """Resolve the stream of an upcoming track for the prefetcher.
+
+        The next track is also downloaded into the audio cache while the
+        current one plays, so it is played from the file. Tracks are never
+        cached while they play, since playbin is already downloading them.
 
+        Args:
+            track: The Track object to resolve
+
+        Returns:
+            tuple: The stream and the parsed stream manifest
+        """
+        stream, manifest = self._resolve_stream(track)
+
+        next_tracks = self.prefetcher.targets[:1]
+        if not next_tracks or next_tracks[0].id != track.id:
+            return stream, manifest
+
+        urls = manifest.get_urls()
+        if stream.manifest_mime_type == ManifestMimeType.MPD:
+            # The segments joined in order make a playable fragmented MP4
+            utils.audio_cache.cache_stream(track.id, stream.audio_quality, urls)
+        elif stream.manifest_mime_type == ManifestMimeType.BTS:
+            urls = urls[:1] if isinstance(urls, list) else [urls]
+            utils.audio_cache.cache_stream(track.id, stream.audio_quality, urls)
+
+        return stream, manifest
+
+    def _load_track(self, track: Track, gapless: bool, generation: int) -> None:
+        """Load a track on the loader thread and hand it to the pipeline.
+
+        Nothing is changed if a newer track was requested in the meantime.
+
+        Args:
+            track: The Track object to play
+            gapless: Whether to enqueue the track for gapless playback
+            generation (int): The request number, to detect newer requests
+        """
+        try:
+            resolved = self.prefetcher.take(track)
+            if resolved is None:
+                resolved = self._resolve_stream(track)
+            stream, manifest = resolved
+            if self._is_superseded(generation):
+                return
+
+            quality = stream.audio_quality
+            cached_path = utils.audio_cache.get(track.id, quality)
+
+            if cached_path:
+                music_url = "file://{}".format(cached_path)
+            elif stream.manifest_mime_type == ManifestMimeType.MPD:
+                data = stream.get_manifest_data()
+                if data:
+                    mpd_path = utils.manifest_store.write(data)
                     music_url = "file://{}".format(mpd_path)
                 else:
                     raise AttributeError("No MPD manifest available!")
-            elif self.stream.manifest_mime_type == ManifestMimeType.BTS:
-                urls = self.manifest.get_urls()
+            elif stream.manifest_mime_type == ManifestMimeType.BTS:
+                urls = manifest.get_urls()
                 if isinstance(urls, list):
                     music_url = urls[0]
                 else:
                     music_url = urls
 
-            GLib.idle_add(self._play_track_url, track, music_url, gapless)
+            if self._is_superseded(generation):
+                return
+
+            self.stream = stream
+            self.manifest = manifest
+
+            # When not gapless there is a race condition between get_stream() and on_track_start
+            if not gapless:
+                self.apply_replaygain_tags()
+
+            GLib.idle_add(self._play_track_url, track, music_url, gapless, generation)
         except Exception:
             logger.exception("Error getting track URL")
 
@@ -515,8 +1146,11 @@ class PlayerObject(GObject.GObject):
         # toggling the option
         self.most_recent_rg_tags = f"tags={tags}"
 
-    def _play_track_url(self, track, music_url, gapless=False):
+    def _play_track_url(self, track, music_url, gapless=False, generation=None):
         """Set up and play track from URL."""
+        if generation is not None and self._is_superseded(generation):
+            return
+
         if not gapless:
             self.use_about_to_finish = False
             self.pipeline.set_state(Gst.State.NULL)
@@ -543,7 +1177,11 @@ class PlayerObject(GObject.GObject):
             playbin: required by Gst
         """
         # playbin is need as arg but we access it later over self
-        if self.gapless_enabled and self.use_about_to_finish and self.tracks_to_play:
+        if (
+            self.gapless_enabled
+            and self.use_about_to_finish
+            and (self.queue or self.play_queue.has_next())
+        ):
             GLib.idle_add(self.play_next, True)
             logger.info("Trying gapless playbck")
         else:
@@ -580,24 +1218,17 @@ class PlayerObject(GObject.GObject):
             self.play_track(track, gapless=gapless)
             return
 
-        if not self._tracks_to_play and self._repeat_type == RepeatType.LIST:
-            self._tracks_to_play = self.played_songs
-            self.tracks_to_play = self._tracks_to_play
+        if not self.play_queue.has_next() and self._repeat_type == RepeatType.LIST:
+            self.play_queue.restart()
             self.played_songs = []
+            self.history_version += 1
 
-        if not self._tracks_to_play:
+        if not self.play_queue.has_next():
             self.pause()
             return
 
-        track_list = []
-        if self.shuffle:
-            track_list = self._shuffled_tracks_to_play
-        else:
-            track_list = self._tracks_to_play
-
-        if track_list and len(track_list) > 0:
-            track = track_list.pop(0)
-            self.play_track(track, gapless=gapless)
+        self.play_queue.next()
+        self._play_current(gapless)
 
     def play_previous(self):
         """Play the previous track or restart current track if near beginning."""
@@ -614,10 +1245,14 @@ class PlayerObject(GObject.GObject):
         if not self.played_songs:
             return
 
-        last_index = len(self.played_songs) - 1
-        track = self.played_songs.pop(last_index)
+        track = self.played_songs.pop()
+        self.history_version += 1
         if self.playing_track:
-            self._tracks_to_play.insert(0, self.playing_track)
+            # Put the current track back in front of the upcoming ones
+            if self.playing_track is self.play_queue.current():
+                self.play_queue.previous()
+            else:
+                self.queue.insert(0, self.playing_track)
         self.play_track(track)
 
     def previous_timer_callback(self):
@@ -625,13 +1260,10 @@ class PlayerObject(GObject.GObject):
         self.can_go_prev = True
         self.notify("can-go-prev")
 
-    def _update_shuffle_queue(self):
-        if self.shuffle:
-            self._shuffled_tracks_to_play = self._tracks_to_play.copy()
-            random.shuffle(self._shuffled_tracks_to_play)
-            self.tracks_to_play = self._shuffled_tracks_to_play
-        else:
-            self.tracks_to_play = self._tracks_to_play
+    @property
+    def tracks_to_play(self) -> List[Track]:
+        """The upcoming tracks of the playing context, in play order"""
+        return self.play_queue.upcoming()
 
     def add_to_queue(self, track):
         """Add a track to the end of the play queue.
@@ -640,7 +1272,9 @@ class PlayerObject(GObject.GObject):
             track: The Track object to add to the queue
         """
         self.queue.append(track)
+        self.history_version += 1
         self.emit("song-added-to-queue")
+        self._prefetch_next()
 
     def add_next(self, track):
         """Add a track to the top of the queue.
@@ -649,7 +1283,9 @@ class PlayerObject(GObject.GObject):
             track: The Track object to play next
         """
         self.queue.insert(0, track)
+        self.history_version += 1
         self.emit("song-added-to-queue")
+        self._prefetch_next()
 
     def query_volume(self):
         """Get the current playback volume.
@@ -669,20 +1305,91 @@ class PlayerObject(GObject.GObject):
         Args:
             value (float): Volume level (0.0 to 1.0), will be squared if quadratic volume is enabled
         """
+        self._volume = value
         if self.quadratic_volume:
             self.playbin.set_property("volume", value**2)
         else:
             self.playbin.set_property("volume", value)
         self.emit("volume-changed", value)
 
+    def _on_volume_notify(self, *args) -> None:
+        # Notified from the streaming thread when the sink volume changes
+        GLib.idle_add(self._emit_volume_changed)
+
+    def _emit_volume_changed(self) -> bool:
+        volume = self.playbin.get_property("volume")
+        value = volume ** (1 / 2) if self.quadratic_volume else volume
+        # Changes made with change_volume() were already emitted
+        if self._volume is None or abs(value - self._volume) > 1e-6:
+            self._volume = value
+            self.emit("volume-changed", value)
+        return GLib.SOURCE_REMOVE
+
+    def set_update_interval(self, interval: int) -> None:
+        """Set how often update-slider is emitted while playing.
+
+        Args:
+            interval (int): Milliseconds between updates, 0 to stop them
+        """
+        if interval == self.update_interval:
+            return
+        self.update_interval = interval
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        if self.update_timer:
+            GLib.source_remove(self.update_timer)
+            self.update_timer = None
+        if self.playing and self.update_interval > 0:
+            self.update_timer = GLib.timeout_add(
+                self.update_interval, self._update_slider_callback
+            )
+
     def _update_slider_callback(self):
         """Update playback slider and duration."""
-        self.update_timer = None
         if not self.duration:
             logger.warning("Duration missing, trying again")
             self.duration = self.query_duration()
         self.emit("update-slider")
-        return self.playing
+        if self.playing:
+            return True
+        self.update_timer = None
+        return False
+
+    def _sync_position(self) -> None:
+        success, position = self.playbin.query_position(Gst.Format.TIME)
+        if success:
+            self._position_snapshot = (position, GLib.get_monotonic_time())
+        else:
+            self._position_snapshot = None
+
+    def get_position(self, default=0) -> int | None:
+        """Get the playback position without querying the pipeline every time.
+
+        The position is extrapolated from the last pipeline query while
+        playing, and queried again every POSITION_RESYNC_INTERVAL.
+
+        Args:
+            default (int): Default value to return if query fails (default: 0)
+
+        Returns:
+            int: Position in nanoseconds, or default value if query failed
+        """
+        now = GLib.get_monotonic_time()
+        if (
+            self._position_snapshot is None
+            or now - self._position_snapshot[1] > POSITION_RESYNC_INTERVAL
+        ):
+            self._sync_position()
+            if self._position_snapshot is None:
+                return default
+
+        position, time = self._position_snapshot
+        if self.playing:
+            position += (now - time) * 1000
+        if self.duration:
+            position = min(position, self.duration)
+        return position
 
     def query_duration(self):
         """Get the duration of the current track.
@@ -723,6 +1430,8 @@ class PlayerObject(GObject.GObject):
         self.playbin.seek_simple(
             Gst.Format.TIME, Gst.SeekFlags.FLUSH | Gst.SeekFlags.KEY_UNIT, position
         )
+        # The pipeline reports the old position until the seek is done
+        self._position_snapshot = (position, GLib.get_monotonic_time())
 
         if self.discord_rpc_enabled:
             discord_rpc.set_activity(self.playing_track, position / 1_000_000)
@@ -749,7 +1458,4 @@ class PlayerObject(GObject.GObject):
         Returns:
             int: Index of current track, or 0 if not found
         """
-        for index, track_id in enumerate(self.id_list):
-            if track_id == self.playing_track.id:
-                return index
-        return 0
+        return max(self.play_queue.index_of(self.playing_track), 0)
@@ -0,0 +1,148 @@
+# stream_prefetcher.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from tidalapi import Track
+
+logger = logging.getLogger(__name__)
+
+# Stream URLs are signed and expire, so prefetched streams older than this
+# many seconds are fetched again
+MAX_AGE = 15 * 60
+
+
+class HTStreamPrefetcher:
+    """Resolves the streams of the upcoming tracks in the background.
+
+    The player tells the prefetcher which tracks come next, and a single
+    worker thread resolves their stream and manifest one at a time, so the
+    about-to-finish handler finds them ready instead of waiting on the
+    network. Resolved streams of tracks that are not upcoming anymore are
+    dropped.
+    """
+
+    def __init__(self, resolve: Callable[[Track], Any]) -> None:
+        """Create the prefetcher and start its worker thread.
+
+        Args:
+            resolve: A function returning the resolved stream of a track,
+                called from the worker thread
+        """
+        self.resolve = resolve
+
+        self.targets: List[Track] = []
+        self.resolved: Dict[Any, Tuple[Any, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        self._in_flight: Any | None = None
+        self._generation = 0
+        self._condition = threading.Condition()
+
+        threading.Thread(
+            target=self._work, name="stream-prefetcher", daemon=True
+        ).start()
+
+    def prefetch(self, tracks: List[Track]) -> None:
+        """Set the tracks that should be resolved ahead of time.
+
+        Args:
+            tracks: The upcoming tracks, in the order they will be played
+        """
+        with self._condition:
+            self.targets = list(tracks)
+            ids = {track.id for track in self.targets}
+            for track_id in list(self.resolved):
+                if track_id not in ids:
+                    del self.resolved[track_id]
+            self._condition.notify_all()
+
+    def invalidate(self) -> None:
+        """Drop every resolved stream, for example after a quality change"""
+        with self._condition:
+            self.resolved.clear()
+            self._generation += 1
+            self._condition.notify_all()
+
+    def take(self, track: Track) -> Any | None:
+        """Get the prefetched stream of a track, removing it.
+
+        If the track is being resolved right now, this waits for it instead
+        of starting a second request.
+
+        Args:
+            track: The track about to be played
+
+        Returns:
+            The resolved stream, or None if it was not prefetched
+        """
+        with self._condition:
+            while self._in_flight == track.id:
+                self._condition.wait()
+
+            self.targets = [t for t in self.targets if t.id != track.id]
+            entry = self.resolved.pop(track.id, None)
+            if entry is None or time.time() - entry[1] > MAX_AGE:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            logger.info(
+                f"Using prefetched stream for {track.id} "
+                f"({self.hits} hits, {self.misses} misses)"
+            )
+            return entry[0]
+
+    def _next_target(self) -> Track | None:
+        for track in self.targets:
+            entry = self.resolved.get(track.id)
+            if entry is None or time.time() - entry[1] > MAX_AGE:
+                return track
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                track = self._next_target()
+                while track is None:
+                    self._condition.wait()
+                    track = self._next_target()
+                self._in_flight = track.id
+                generation = self._generation
+
+            try:
+                resolved = self.resolve(track)
+            except Exception:
+                logger.exception(f"Could not prefetch the stream of {track.id}")
+                resolved = None
+
+            with self._condition:
+                self._in_flight = None
+                if resolved is None:
+                    # Do not retry until the upcoming tracks change
+                    self.targets = [t for t in self.targets if t.id != track.id]
+                elif generation == self._generation and any(
+                    t.id == track.id for t in self.targets
+                ):
+                    self.resolved[track.id] = (resolved, time.time())
+                self._condition.notify_all()
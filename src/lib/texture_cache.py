@@ -0,0 +1,116 @@
+# texture_cache.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import threading
+from collections import OrderedDict
+
+from gi.repository import Gdk, GdkPixbuf, GLib
+
+logger = logging.getLogger(__name__)
+
+
+class HTTextureCache:
+    """Memory-bounded LRU cache of decoded textures.
+
+    Textures are keyed by the cached image path, which already encodes the
+    item id and the downloaded size, and by the size they were decoded at,
+    so every widget showing the same cover at the same size shares one
+    decoded texture. Loading is thread safe and meant to run on a worker
+    thread, so the main thread only receives ready textures.
+    """
+
+    def __init__(self, max_size: int = 128 * 1024 * 1024) -> None:
+        self.max_size = max_size
+
+        self.textures: OrderedDict[str, Gdk.Texture] = OrderedDict()
+        self.size = 0
+
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Gdk.Texture | None:
+        """Get a cached texture and mark it as recently used.
+
+        Args:
+            key (str): The texture key
+
+        Returns:
+            Gdk.Texture: The cached texture, or None if it is not cached
+        """
+        with self._lock:
+            texture = self.textures.get(key)
+            if texture is not None:
+                self.textures.move_to_end(key)
+            return texture
+
+    def put(self, key: str, texture: Gdk.Texture) -> None:
+        """Add a texture to the cache, evicting the least recently used ones.
+
+        Args:
+            key (str): The texture key
+            texture (Gdk.Texture): The decoded texture
+        """
+        with self._lock:
+            old_texture = self.textures.pop(key, None)
+            if old_texture is not None:
+                self.size -= self._texture_size(old_texture)
+
+            self.textures[key] = texture
+            self.size += self._texture_size(texture)
+
+            while self.size > self.max_size and len(self.textures) > 1:
+                _key, evicted = self.textures.popitem(last=False)
+                self.size -= self._texture_size(evicted)
+
+    def load(self, path: str, size: int | None = None) -> Gdk.Texture | None:
+        """Get the texture for an image file, decoding it on a cache miss.
+
+        Args:
+            path (str): Path to the image file
+            size (int): Optional edge in pixels to downscale the image to
+                while decoding, keeping the aspect ratio
+
+        Returns:
+            Gdk.Texture: The texture, or None if the file could not be decoded
+        """
+        key = f"{path}:{size}" if size else path
+
+        texture = self.get(key)
+        if texture is not None:
+            return texture
+
+        try:
+            if size:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                    path, size, size, True
+                )
+                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+            else:
+                texture = Gdk.Texture.new_from_filename(path)
+        except GLib.Error:
+            logger.exception(f"Could not decode {path}")
+            return None
+
+        self.put(key, texture)
+        return texture
+
+    @staticmethod
+    def _texture_size(texture: Gdk.Texture) -> int:
+        # Textures are stored as 4 bytes per pixel once uploaded
+        return texture.get_width() * texture.get_height() * 4
@@ -25,15 +25,20 @@ import threading
 import uuid
 import logging
 from gettext import gettext as _
-from pathlib import Path
 from typing import Any, List
 
-import requests
-from gi.repository import Adw, Gdk, Gio, GLib
+from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 from tidalapi import Album, Artist, Mix, Playlist, Track
 
 from ..pages import HTAlbumPage, HTArtistPage, HTMixPage, HTPlaylistPage
+from .artwork_loader import HTArtworkLoader, Priority
+from .audio_cache import HTAudioCache
 from .cache import HTCache
+from .http_client import HTHttpClient
+from .image_cache import HTImageCache
+from .manifest_store import HTManifestStore
+from .metadata_store import HTMetadataStore
+from .texture_cache import HTTextureCache
 
 logger = logging.getLogger(__name__)
 
@@ -58,17 +63,40 @@ def init() -> None:
         CACHE_DIR = f"{os.environ.get('HOME')}/.cache/high-tide"
     global IMG_DIR
     IMG_DIR = f"{CACHE_DIR}/images"
+    global AUDIO_DIR
+    AUDIO_DIR = f"{CACHE_DIR}/audio"
+    global MANIFEST_DIR
+    MANIFEST_DIR = f"{CACHE_DIR}/manifests"
 
     if not os.path.exists(IMG_DIR):
         os.makedirs(IMG_DIR)
+    if not os.path.exists(AUDIO_DIR):
+        os.makedirs(AUDIO_DIR)
+    if not os.path.exists(MANIFEST_DIR):
+        os.makedirs(MANIFEST_DIR)
 
     global session
     global navigation_view
     global player_object
     global toast_overlay
     global cache
+    global image_cache
+    global audio_cache
+    global http_client
+    global artwork_loader
+    global texture_cache
+    global manifest_store
+    global metadata_store
     session = None
-    cache = HTCache(session)
+    metadata_store = HTMetadataStore(f"{CACHE_DIR}/metadata.sqlite")
+    metadata_store.prune()
+    cache = HTCache(session, metadata_store)
+    image_cache = HTImageCache(IMG_DIR)
+    http_client = HTHttpClient()
+    audio_cache = HTAudioCache(AUDIO_DIR, http_client)
+    artwork_loader = HTArtworkLoader()
+    texture_cache = HTTextureCache()
+    manifest_store = HTManifestStore(MANIFEST_DIR)
 
 
 def get_alsa_devices() -> List[dict]:
@@ -541,6 +569,11 @@ def get_best_dimensions(widget: Any) -> int:
         int: The best image dimension from available sizes (80, 160, 320, 640, 1280)
     """
     edge = widget.get_height()
+    # Widgets that are not allocated yet still know their requested size
+    if not edge and isinstance(widget, Gtk.Image):
+        edge = widget.get_pixel_size()
+    elif not edge and isinstance(widget, Adw.Avatar):
+        edge = widget.get_size()
     dimensions = [80, 160, 320, 640, 1280]
     # The function for fractional scaling is not available in GTKWidget
     scale = 1.0
@@ -563,76 +596,130 @@ def get_image_url(item: Any, dimensions: int = 320) -> str | None:
         str: Path to the local image file, or None if download failed
     """
     if hasattr(item, "id"):
-        file_path = Path(f"{IMG_DIR}/{item.id}_{dimensions}.jpg")
+        file_name = f"{item.id}_{dimensions}.jpg"
     else:
-        file_path = Path(f"{IMG_DIR}/{uuid.uuid4()}_{dimensions}.jpg")
+        file_name = f"{uuid.uuid4()}_{dimensions}.jpg"
 
-    if file_path.is_file():
-        return str(file_path)
+    def _download() -> bytes | None:
+        response = http_client.get(item.image(dimensions=dimensions))
+        return response.content if response.status_code == 200 else None
 
     try:
-        picture_url = item.image(dimensions=dimensions)
-        response = requests.get(picture_url)
+        return image_cache.fetch(file_name, _download)
     except Exception:
         logger.exception("Could not get image")
         return None
-    if response.status_code == 200:
-        picture_data = response.content
 
-        with open(file_path, "wb") as file:
-            file.write(picture_data)
 
-    return str(file_path)
+def load_texture(
+    file_path: str | None, size: int | None = None
+) -> Gdk.Texture | None:
+    """Get the decoded texture for a cached image file.
+
+    Decoding happens in the calling thread, so this should be called from a
+    worker thread and only the resulting texture handed to the main thread.
+    A file that is missing or cannot be decoded is dropped from the image
+    cache, so it is downloaded again the next time.
+
+    Args:
+        file_path: Path to the image file, as returned by get_image_url()
+        size: Optional edge in pixels to downscale the image to while decoding
+
+    Returns:
+        Gdk.Texture: The shared texture, or None if there is no image
+    """
+    if not file_path:
+        return None
+    texture = texture_cache.load(file_path, size)
+    if texture is None:
+        image_cache.discard(os.path.basename(file_path))
+    return texture
+
+
+def get_image_texture(
+    item: Any, size: int, dimensions: int = 320
+) -> Gdk.Texture | None:
+    """Download and decode an item's image at the size a widget displays it.
+
+    Args:
+        item: A TIDAL object with image data
+        size (int): The best dimensions for the widget, from get_best_dimensions()
+        dimensions (int): The image dimensions to download (default: 320)
+
+    Returns:
+        Gdk.Texture: The texture, or None if the image could not be loaded
+    """
+    # Never upscale, a smaller download is only shown at its own size
+    size = size if size < dimensions else None
+
+    file_path = get_image_url(item, dimensions)
+    texture = load_texture(file_path, size)
+    if texture is None and file_path:
+        # The cached file was missing or corrupted, download it again once
+        texture = load_texture(get_image_url(item, dimensions), size)
+    return texture
 
 
 def add_picture(
-    widget: Any, item: Any, cancellable: Gio.Cancellable = Gio.Cancellable.new()
+    widget: Any,
+    item: Any,
+    cancellable: Gio.Cancellable = Gio.Cancellable.new(),
+    size: int = 320,
 ) -> None:
     """Retrieve and set an image for a widget from a TIDAL item.
 
-    Downloads the image if necessary and sets it on the widget using set_filename().
+    Downloads the image if necessary and sets it on the widget using
+    set_paintable(), sharing the decoded texture through the texture cache.
 
     Args:
-        widget: A GTK widget that supports set_filename()
+        widget: A GTK widget that supports set_paintable()
         item: A TIDAL object with image data
         cancellable: Optional GCancellable for canceling the operation
+        size (int): The best dimensions for the widget, measured on the main
+            thread with get_best_dimensions() (default: 320)
     """
 
     if cancellable is None:
         cancellable = Gio.Cancellable.new()
 
-    def _add_picture(widget, file_path, cancellable):
+    def _add_picture(widget, texture, cancellable):
         if not cancellable.is_cancelled():
-            widget.set_filename(file_path)
+            widget.set_paintable(texture)
 
     GLib.idle_add(
         _add_picture,
         widget,
-        get_image_url(item, get_best_dimensions(widget)),
+        get_image_texture(item, size, size),
         cancellable,
     )
 
 
 def add_image(
-    widget: Any, item: Any, cancellable: Gio.Cancellable = Gio.Cancellable.new()
+    widget: Any,
+    item: Any,
+    cancellable: Gio.Cancellable = Gio.Cancellable.new(),
+    size: int = 320,
 ) -> None:
     """Retrieve and set an image for a widget from a TIDAL item.
 
-    Downloads the image if necessary and sets it on the widget using set_from_file().
+    Downloads the image if necessary and sets it on the widget using
+    set_from_paintable(), sharing the decoded texture through the texture cache.
 
     Args:
-        widget: A GTK widget that supports set_from_file()
+        widget: A GTK widget that supports set_from_paintable()
         item: A TIDAL object with image data
         cancellable: Optional GCancellable for canceling the operation
+        size (int): The best dimensions for the widget, measured on the main
+            thread with get_best_dimensions() (default: 320)
     """
 
     def _add_image(
-        widget: Any, file_path: str | None, cancellable: Gio.Cancellable
+        widget: Any, texture: Gdk.Texture | None, cancellable: Gio.Cancellable
     ) -> None:
         if not cancellable.is_cancelled():
-            widget.set_from_file(file_path)
+            widget.set_from_paintable(texture)
 
-    GLib.idle_add(_add_image, widget, get_image_url(item), cancellable)
+    GLib.idle_add(_add_image, widget, get_image_texture(item, size), cancellable)
 
 
 def get_video_cover_url(item: Any, dimensions: int = 320) -> str | None:
@@ -646,26 +733,19 @@ def get_video_cover_url(item: Any, dimensions: int = 320) -> str | None:
         str: Path to the local video file, or None if download failed
     """
     if hasattr(item, "id"):
-        file_path = Path(f"{IMG_DIR}/{item.id}_{dimensions}.mp4")
+        file_name = f"{item.id}_{dimensions}.mp4"
     else:
-        file_path = Path(f"{IMG_DIR}/{uuid.uuid4()}_{dimensions}.mp4")
+        file_name = f"{uuid.uuid4()}_{dimensions}.mp4"
 
-    if file_path.is_file():
-        return str(file_path)
+    def _download() -> bytes | None:
+        response = http_client.get(item.video(dimensions=dimensions))
+        return response.content if response.status_code == 200 else None
 
     try:
-        video_url = item.video(dimensions=dimensions)
-        response = requests.get(video_url)
+        return image_cache.fetch(file_name, _download)
     except Exception:
         logger.exception("Could not get video")
         return None
-    if response.status_code == 200:
-        picture_data = response.content
-
-        with open(file_path, "wb") as file:
-            file.write(picture_data)
-
-    return str(file_path)
 
 
 def add_video_cover(
@@ -674,6 +754,7 @@ def add_video_cover(
     item: Any,
     in_bg: bool,
     cancellable: Gio.Cancellable = Gio.Cancellable.new(),
+    size: int = 320,
 ) -> None:
     """Retrieve and set a video cover for a video player widget from a TIDAL item.
 
@@ -685,6 +766,8 @@ def add_video_cover(
         item: A TIDAL object with video data
         in_bg (bool): Whether the window is currently in background (not in focus)
         cancellable: Optional GCancellable for canceling the operation
+        size (int): The best dimensions for the widget, measured on the main
+            thread with get_best_dimensions() (default: 320)
     """
 
     if cancellable is None:
@@ -708,14 +791,17 @@ def add_video_cover(
         _add_video_cover,
         widget,
         videoplayer,
-        get_video_cover_url(item, get_best_dimensions(widget)),
+        get_video_cover_url(item, size),
         in_bg,
         cancellable,
     )
 
 
 def add_image_to_avatar(
-    widget: Any, item: Any, cancellable: Gio.Cancellable = Gio.Cancellable.new()
+    widget: Any,
+    item: Any,
+    cancellable: Gio.Cancellable = Gio.Cancellable.new(),
+    size: int = 320,
 ) -> None:
     """Retrieve and set an image for an Adwaita Avatar widget from a TIDAL item.
 
@@ -723,17 +809,56 @@ def add_image_to_avatar(
         widget: An Adw.Avatar widget
         item: A TIDAL object with image data
         cancellable: Optional GCancellable for canceling the operation
+        size (int): The best dimensions for the widget, measured on the main
+            thread with get_best_dimensions() (default: 320)
     """
 
     def _add_image_to_avatar(
-        avatar_widget: Any, file_path: str | None, cancellable: Gio.Cancellable
+        avatar_widget: Any, texture: Gdk.Texture | None, cancellable: Gio.Cancellable
     ) -> None:
-        if not cancellable.is_cancelled():
-            file = Gio.File.new_for_path(file_path)
-            image = Gdk.Texture.new_from_file(file)
-            widget.set_custom_image(image)
+        if not cancellable.is_cancelled() and texture:
+            widget.set_custom_image(texture)
+
+    GLib.idle_add(
+        _add_image_to_avatar, widget, get_image_texture(item, size), cancellable
+    )
+
 
-    GLib.idle_add(_add_image_to_avatar, widget, get_image_url(item), cancellable)
+def queue_image(
+    widget: Any,
+    item: Any,
+    cancellable: Gio.Cancellable | None = None,
+    add_function: Any = None,
+    priority: Priority = Priority.NORMAL,
+) -> None:
+    """Queue loading an image for a widget on the shared artwork loader.
+
+    The widget is measured here, on the main thread, and the workers only
+    get the resulting size.
+
+    Args:
+        widget: The GTK widget to set the image on
+        item: A TIDAL object with image data
+        cancellable: Optional GCancellable, cancelling it drops the pending load
+        add_function: The function setting the image, one of add_image,
+            add_picture or add_image_to_avatar (default: add_image)
+        priority (Priority): The loading priority (default: NORMAL)
+    """
+    if cancellable is None:
+        cancellable = Gio.Cancellable.new()
+    if add_function is None:
+        add_function = add_image
+
+    artwork_loader.submit(
+        add_function,
+        widget,
+        item,
+        cancellable,
+        get_best_dimensions(widget),
+        widget=widget,
+        cancellable=cancellable,
+        priority=priority,
+    )
 
 
 def replace_links(text: str) -> str:
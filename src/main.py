@@ -53,6 +53,13 @@ class HighTideApplication(Adw.Application):
 
         self.settings: Gio.Settings = Gio.Settings.new("io.github.nokse22.high-tide")
 
+        utils.image_cache.set_max_size(
+            self.settings.get_int("image-cache-size") * 1024 * 1024
+        )
+        utils.audio_cache.set_max_size(
+            self.settings.get_int("audio-cache-size") * 1024 * 1024
+        )
+
         self.preferences: Gtk.Window | None = None
 
         self.alsa_devices = utils.get_alsa_devices()
@@ -69,6 +76,16 @@ class HighTideApplication(Adw.Application):
             else:
                 self.win.queued_uri = uri
 
+    def do_shutdown(self) -> None:
+        """Persist caches before the application exits."""
+        utils.image_cache.save_index()
+        utils.audio_cache.save_index()
+        utils.audio_cache.log_stats()
+        utils.http_client.log_stats()
+        utils.cache.log_stats()
+
+        Adw.Application.do_shutdown(self)
+
     def on_login_action(self, *args) -> None:
         """Handle the login action by initiating a new login process."""
         self.win.new_login()
@@ -167,6 +184,20 @@ class HighTideApplication(Adw.Application):
                 "notify::active", self.on_discord_rpc_changed
             )
 
+            builder.get_object("_image_cache_size_row").set_value(
+                self.settings.get_int("image-cache-size")
+            )
+            builder.get_object("_image_cache_size_row").connect(
+                "notify::value", self.on_image_cache_size_changed
+            )
+
+            builder.get_object("_audio_cache_size_row").set_value(
+                self.settings.get_int("audio-cache-size")
+            )
+            builder.get_object("_audio_cache_size_row").connect(
+                "notify::value", self.on_audio_cache_size_changed
+            )
+
             self.alsa_row = builder.get_object("_alsa_device_row")
 
             # Create a new label factory to just set max_width
@@ -241,6 +272,12 @@ class HighTideApplication(Adw.Application):
     def on_discord_rpc_changed(self, widget: Any, *args) -> None:
         self.win.change_discord_rpc_enabled(widget.get_active())
 
+    def on_image_cache_size_changed(self, widget: Any, *args) -> None:
+        self.win.change_image_cache_size(int(widget.get_value()))
+
+    def on_audio_cache_size_changed(self, widget: Any, *args) -> None:
+        self.win.change_audio_cache_size(int(widget.get_value()))
+
     def deactive_alsa_device_row(self, widget: Any, *args) -> None:
         alsa_used = widget.get_selected() == AudioSink.ALSA
         self.alsa_row.set_sensitive(alsa_used)
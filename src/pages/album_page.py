@@ -17,7 +17,6 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import threading
 from gettext import gettext as _
 
 from gi.repository import Gtk
@@ -31,11 +30,11 @@ class HTAlbumPage(Page):
 
     __gtype_name__ = "HTAlbumPage"
 
-    top_tracks = []
+    tracks = None
 
     def _load_async(self) -> None:
         self.item = utils.get_album(self.id)
-        self.top_tracks = self.item.tracks(limit=50)
+        self.tracks = self.item.tracks(limit=50)
 
     def _load_finish(self) -> None:
         self.set_title(self.item.name)
@@ -47,9 +46,10 @@ class HTAlbumPage(Page):
         self.append(builder.get_object("_main"))
 
         auto_load = builder.get_object("_auto_load")
-        auto_load.set_scrolled_window(self.scrolled_window)
+        self.disconnectables.append(auto_load)
         auto_load.set_function(self.item.tracks)
-        auto_load.set_items(self.top_tracks)
+        auto_load.set_context(self.item)
+        auto_load.set_items(self.tracks)
 
         builder.get_object("_title_label").set_label(self.item.name)
         builder.get_object("_first_subtitle_label").set_label(
@@ -96,4 +96,6 @@ class HTAlbumPage(Page):
             in_my_collection_btn.set_icon_name("heart-filled-symbolic")
 
         image = builder.get_object("_image")
-        threading.Thread(target=utils.add_image, args=(image, self.item)).start()
+        utils.queue_image(
+            image, self.item, self.cancellable, priority=utils.Priority.HIGH
+        )
@@ -18,7 +18,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
-import threading
 from gettext import gettext as _
 from typing import List
 
@@ -129,9 +128,13 @@ class HTArtistPage(Page):
 
         artist_picture = builder.get_object("_avatar")
 
-        threading.Thread(
-            target=utils.add_image_to_avatar, args=(artist_picture, self.artist)
-        ).start()
+        utils.queue_image(
+            artist_picture,
+            self.artist,
+            self.cancellable,
+            add_function=utils.add_image_to_avatar,
+            priority=utils.Priority.HIGH,
+        )
 
         builder.get_object("_first_subtitle_label").set_label(_("Artist"))
 
@@ -182,7 +185,7 @@ class HTArtistPage(Page):
         self.signals.append((label, label.connect("activate-link", utils.open_uri)))
 
     def on_play_button_clicked(self, btn) -> None:
-        utils.player_object.play_this(self.top_tracks, 0)
+        utils.player_object.play_this(self.top_tracks)
 
     def on_shuffle_button_clicked(self, btn) -> None:
-        utils.player_object.shuffle_this(self.top_tracks, 0)
+        utils.player_object.shuffle_this(self.top_tracks)
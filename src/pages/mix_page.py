@@ -17,7 +17,6 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import threading
 
 from gi.repository import Gtk
 
@@ -87,7 +86,8 @@ class HTMixPage(Page):
         self.append(builder.get_object("_main"))
 
         auto_load = builder.get_object("_auto_load")
-        auto_load.set_scrolled_window(self.scrolled_window)
+        self.disconnectables.append(auto_load)
+        auto_load.set_context(self.item)
         auto_load.set_items(self.tracks)
 
         builder.get_object("_title_label").set_label(self.item.title)
@@ -119,4 +119,6 @@ class HTMixPage(Page):
             in_my_collection_btn.set_icon_name("heart-filled-symbolic")
 
         image = builder.get_object("_image")
-        threading.Thread(target=utils.add_image, args=(image, self.item)).start()
+        utils.queue_image(
+            image, self.item, self.cancellable, priority=utils.Priority.HIGH
+        )
@@ -20,7 +20,7 @@
 import threading
 from gettext import gettext as _
 
-from gi.repository import Adw, GLib, Gtk
+from gi.repository import Adw, Gio, GLib, Gtk
 from tidalapi import Video
 
 from ..disconnectable_iface import IDisconnectable
@@ -44,6 +44,8 @@ class Page(Adw.NavigationPage, IDisconnectable):
     __gtype_name__ = "Page"
 
     id = None
+    # Tracks of the page item that are already loaded, to start playback fast
+    tracks = None
 
     @classmethod
     def new_from_id(cls, id):
@@ -79,6 +81,9 @@ class Page(Adw.NavigationPage, IDisconnectable):
 
         self.set_child(self.object)
 
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
+
     def load(self):
         """Load the page content asynchronously.
 
@@ -162,7 +167,7 @@ class Page(Adw.NavigationPage, IDisconnectable):
         Args:
             btn: The play button widget that was clicked
         """
-        utils.player_object.play_this(self.item)
+        utils.player_object.play_this(self.item, tracks=self.tracks)
 
     def on_shuffle_button_clicked(self, btn) -> None:
         """Handle shuffle button clicks by starting shuffled playback.
@@ -170,7 +175,7 @@ class Page(Adw.NavigationPage, IDisconnectable):
         Args:
             btn: The shuffle button widget that was clicked
         """
-        utils.player_object.shuffle_this(self.item)
+        utils.player_object.shuffle_this(self.item, self.tracks)
 
     def new_link_carousel_for(self, title, items) -> None:
         """Create a carousel of page link buttons.
@@ -320,7 +325,6 @@ class Page(Adw.NavigationPage, IDisconnectable):
             return
 
         auto_load = HTAutoLoadWidget()
-        auto_load.set_scrolled_window(self.scrolled_window)
 
         if more_function:
             auto_load.set_function(more_function)
@@ -1,4 +1,5 @@
 from .auto_load_widget import HTAutoLoadWidget
+from .card_grid_view import HTCardGridView, HTCardItem
 from .card_widget import HTCardWidget
 from .carousel_widget import HTCarouselWidget
 from .generic_track_widget import HTGenericTrackWidget
@@ -7,4 +8,5 @@ from .lyrics_widget import HTLyricsWidget
 from .queue_widget import HTQueueWidget
 from .shortcuts_widget import HTShorcutsWidget, HTShorcutWidget
 from .top_hit_widget import HTTopHitWidget
+from .track_list_view import HTTrackItem, HTTrackListView
 from .tracks_list_widget import HTTracksListWidget
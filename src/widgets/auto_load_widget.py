@@ -18,22 +18,43 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import threading
+import time
 
-from gi.repository import GLib, GObject, Gtk
+from gi.repository import Gio, GLib, Gtk
 
 from ..disconnectable_iface import IDisconnectable
 from ..lib import utils
-from .card_widget import HTCardWidget
-from .generic_track_widget import HTGenericTrackWidget
+from .card_grid_view import HTCardGridView
+from .track_list_view import HTTrackListView
 
 import logging
 logger = logging.getLogger(__name__)
 
+# The next page is shown when the end is less than this many screens away
+READ_AHEAD_SCREENS = 2
+
+# The page size grows while pages load faster than the target latency and
+# shrinks when they are slower, so the next page is quick to arrive
+MIN_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+TARGET_LATENCY = 0.5
+
 
 @Gtk.Template(
     resource_path="/io/github/nokse22/high-tide/ui/widgets/auto_load_widget.ui"
 )
 class HTAutoLoadWidget(Gtk.Box, IDisconnectable):
+    """Shows tracks or cards and loads more of them while scrolling.
+
+    One page of items is always fetched ahead and kept buffered, and it is
+    shown when the user scrolls within READ_AHEAD_SCREENS of the end, so the
+    spinner only appears when scrolling faster than the API answers.
+
+    The list or grid only recycles its widgets when it is the scrollable
+    child of a scrolled window, so the widget scrolls it in its own scrolled
+    window below the rest of the page, with the spinner under it.
+    """
+
     __gtype_name__ = "HTAutoLoadWidget"
 
     content = Gtk.Template.Child()
@@ -45,19 +66,28 @@ class HTAutoLoadWidget(Gtk.Box, IDisconnectable):
 
         self.function = None
         self.type = None
+        self.context = None
 
         self.parent = None
 
         self.is_loading = False
+        # Whether the user is waiting for the page being fetched
+        self.is_waiting = False
+        self.is_finished = False
+        self.buffer = None
 
         self.items = []
 
         self.items_limit = 50
         self.items_n = 0
+        # Items fetched so far, shown or buffered
+        self.items_fetched = 0
 
-        self.handler_id = None
         self.scrolled_window = None
 
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
+
     def set_function(self, function: callable) -> None:
         """
         Set the function to use to fetch new items, it needs to support limit and
@@ -68,6 +98,16 @@ class HTAutoLoadWidget(Gtk.Box, IDisconnectable):
         """
         self.function = function
 
+    def set_context(self, context) -> None:
+        """
+        Set the album, playlist or mix the tracks belong to, so playback can
+            continue past the loaded tracks
+
+        Args:
+            context: the TIDAL object
+        """
+        self.context = context
+
     def set_items(self, items: list) -> None:
         """
         Call once to set the initial items to display. Subsequent calls are ignored
@@ -75,96 +115,145 @@ class HTAutoLoadWidget(Gtk.Box, IDisconnectable):
         Args:
             items (list): the list of items
         """
-        if len(self.items) > 0:
+        if len(self.items) > 0 or self.items_fetched > 0:
             logger.warning("You can't set items for HTAutoLoadWidget twice")
             return
 
-        self.items = items
-
-        if self.type is None:
-            self.type = utils.get_type(self.items[0])
-
-        def _add():
-            if self.type == "track":
-                self._add_tracks(self.items)
-            elif self.type is not None:
-                self._add_cards(self.items)
-
-            self.items_n = len(self.items)
-
-        GLib.idle_add(_add)
+        self.items_fetched = len(items)
 
-    def set_scrolled_window(self, scrolled_window) -> None:
-        """
-        Set the scrolled window
+        GLib.idle_add(self._show_items, items)
 
-        Args:
-            scrolled_window (Gtk.ScrolledWindow): the scrolled window
-        """
+    def _watch_scrolled_window(self, scrolled_window) -> None:
         self.scrolled_window = scrolled_window
-        self.handler_id = self.scrolled_window.connect(
-            "edge-reached", self._on_edge_reached
-        )
-        self.signals.append((self.scrolled_window, self.handler_id))
+
+        adjustment = self.scrolled_window.get_vadjustment()
+        self.signals.append((
+            adjustment,
+            adjustment.connect("value-changed", self._on_scrolled),
+        ))
+        self.signals.append((
+            adjustment,
+            adjustment.connect("changed", self._on_scrolled),
+        ))
 
     def th_load_items(self) -> None:
-        """Load more items, this function can be called in a thread"""
-        if self.is_loading or not self.function:
+        """Load the next page of items, this function can be called in a
+        thread"""
+        GLib.idle_add(self._request_more)
+
+    def _on_scrolled(self, adjustment) -> None:
+        page_size = adjustment.get_page_size()
+        distance = adjustment.get_upper() - adjustment.get_value() - page_size
+        if page_size > 0 and distance < READ_AHEAD_SCREENS * page_size:
+            self._request_more()
+
+    def _request_more(self) -> None:
+        if self.buffer is not None:
+            items = self.buffer
+            self.buffer = None
+            self._show_items(items)
+        elif not self.is_finished and self.function:
+            self.is_waiting = True
+            self.spinner.set_visible(True)
+            self._fetch_next()
+
+    def _fetch_next(self) -> None:
+        """Start fetching the next page in the background if needed"""
+        if self.is_loading or self.is_finished or not self.function:
             return
         self.is_loading = True
-        self.spinner.set_visible(True)
-        new_items = []
-        new_items = self.function(limit=self.items_limit, offset=self.items_n)
-        self.items.extend(new_items)
-        if new_items == []:
-            GObject.signal_handler_disconnect(self.scrolled_window, self.handler_id)
+        threading.Thread(
+            target=self._th_fetch,
+            args=(self.items_limit, self.items_fetched, self.cancellable),
+        ).start()
+
+    def _th_fetch(self, limit, offset, cancellable) -> None:
+        start = time.monotonic()
+        try:
+            new_items = self.function(limit=limit, offset=offset)
+        except Exception:
+            logger.exception("Error while loading more items")
+            new_items = None
+        latency = time.monotonic() - start
+
+        GLib.idle_add(self._on_fetched, new_items, latency, cancellable)
+
+    def _on_fetched(self, new_items, latency, cancellable) -> None:
+        # The page was popped while loading
+        if cancellable.is_cancelled():
+            return
+
+        self.is_loading = False
+
+        if new_items is None:
+            self.is_waiting = False
             self.spinner.set_visible(False)
             return
-        elif self.type is None:
-            self.type = utils.get_type(new_items[0])
 
-        def _add():
+        if not new_items:
+            self.is_finished = True
+            self.is_waiting = False
+            self.spinner.set_visible(False)
+            return
+
+        self.items_fetched += len(new_items)
+
+        if latency < TARGET_LATENCY / 2:
+            self.items_limit = min(self.items_limit * 2, MAX_PAGE_SIZE)
+        elif latency > TARGET_LATENCY:
+            self.items_limit = max(self.items_limit // 2, MIN_PAGE_SIZE)
+
+        if self.is_waiting:
+            self.is_waiting = False
+            self.spinner.set_visible(False)
+            self._show_items(new_items)
+        else:
+            self.buffer = new_items
+
+    def _show_items(self, new_items) -> None:
+        if new_items:
+            if self.type is None:
+                self.type = utils.get_type(new_items[0])
+
+            self.items.extend(new_items)
+
             if self.type == "track":
                 self._add_tracks(new_items)
             elif self.type is not None:
                 self._add_cards(new_items)
 
             self.items_n += len(new_items)
-            self.spinner.set_visible(False)
-            self.is_loading = False
-
-        GLib.idle_add(_add)
 
-    def _on_edge_reached(self, scrolled_window, pos):
-        GObject.signal_handler_block(self.scrolled_window, self.handler_id)
-        if pos == Gtk.PositionType.BOTTOM:
-            threading.Thread(target=self.th_load_items).start()
-        GObject.signal_handler_unblock(self.scrolled_window, self.handler_id)
+        # Keep the following page ready
+        if self.buffer is None:
+            self._fetch_next()
 
     def _add_tracks(self, new_items):
         if self.parent is None:
-            self.parent = Gtk.ListBox(css_classes=["tracks-list-box"])
-            self.content.set_child(self.parent)
+            self._set_view(HTTrackListView())
             self.signals.append((
                 self.parent,
-                self.parent.connect("row-activated", self._on_tracks_row_selected),
+                self.parent.connect("track-activated", self._on_track_activated),
             ))
 
-        for index, track in enumerate(new_items):
-            listing = HTGenericTrackWidget(track)
-            self.disconnectables.append(listing)
-            listing.index = index + self.items_n
-            self.parent.append(listing)
+        self.parent.append_tracks(new_items)
 
     def _add_cards(self, new_items):
         if self.parent is None:
-            self.parent = Gtk.FlowBox(selection_mode=0)
-            self.content.set_child(self.parent)
+            self._set_view(HTCardGridView())
+
+        self.parent.append_items(new_items)
 
-        for index, item in enumerate(new_items):
-            card = HTCardWidget(item)
-            self.disconnectables.append(card)
-            self.parent.append(card)
+    def _set_view(self, view):
+        self.parent = view
+        self.disconnectables.append(view)
+
+        scrolled_window = Gtk.ScrolledWindow(
+            hscrollbar_policy=Gtk.PolicyType.NEVER, vexpand=True, child=view
+        )
+        self._watch_scrolled_window(scrolled_window)
+        self.content.set_child(scrolled_window)
 
-    def _on_tracks_row_selected(self, list_box, row):
-        utils.player_object.play_this(self.items, row.index)
+    def _on_track_activated(self, list_view, index):
+        context = self.items if self.context is None else self.context
+        utils.player_object.play_this(context, index, tracks=self.items)
@@ -0,0 +1,91 @@
+# card_grid_view.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any, List
+
+from gi.repository import Gio, GObject, Gtk
+
+from ..disconnectable_iface import IDisconnectable
+from .card_widget import HTCardWidget
+
+
+class HTCardItem(GObject.Object):
+    """An album, artist, playlist or mix in the model of a HTCardGridView"""
+
+    __gtype_name__ = "HTCardItem"
+
+    item = GObject.Property(type=object)
+
+
+class HTCardGridView(Gtk.GridView, IDisconnectable):
+    """A grid of cards that only creates widgets for the visible items.
+
+    The items are kept in a Gio.ListStore of HTCardItem, and a small pool of
+    HTCardWidget is bound to them as they scroll into view. The artwork is
+    loaded when a card is bound and cancelled when it is unbound, so fast
+    scrolling does not queue the covers of cards that are already gone.
+    """
+
+    __gtype_name__ = "HTCardGridView"
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        IDisconnectable.__init__(self)
+
+        self.store = Gio.ListStore(item_type=HTCardItem)
+        self.set_model(Gtk.NoSelection(model=self.store))
+        self.set_max_columns(7)
+
+        factory = Gtk.SignalListItemFactory()
+        self.signals.append((factory, factory.connect("setup", self._on_setup)))
+        self.signals.append((factory, factory.connect("bind", self._on_bind)))
+        self.signals.append((factory, factory.connect("unbind", self._on_unbind)))
+        self.signals.append((factory, factory.connect("teardown", self._on_teardown)))
+        self.set_factory(factory)
+
+        self.add_css_class("cards-grid-view")
+
+    def append_items(self, items: List[Any]) -> None:
+        """Add items at the end of the grid.
+
+        Args:
+            items: The TIDAL objects to add
+        """
+        self.store.splice(
+            self.store.get_n_items(), 0, [HTCardItem(item=item) for item in items]
+        )
+
+    def _on_setup(self, factory, list_item) -> None:
+        card = HTCardWidget()
+        self.disconnectables.append(card)
+        list_item.set_child(card)
+        # Cards handle their own clicks
+        list_item.set_activatable(False)
+
+    def _on_bind(self, factory, list_item) -> None:
+        list_item.get_child().set_item(list_item.get_item().item)
+
+    def _on_unbind(self, factory, list_item) -> None:
+        list_item.get_child().unbind()
+
+    def _on_teardown(self, factory, list_item) -> None:
+        card = list_item.get_child()
+        if card in self.disconnectables:
+            self.disconnectables.remove(card)
+            card.disconnect_all()
@@ -21,7 +21,7 @@ import threading
 from gettext import gettext as _
 from typing import Union
 
-from gi.repository import Adw, GLib, Gtk
+from gi.repository import Adw, Gio, GLib, Gtk
 from tidalapi import Album, Artist, Mix, MixV2, Playlist, Track
 from tidalapi.page import PageItem
 
@@ -36,7 +36,8 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
     This widget automatically configures itself based on the type of TIDAL item
     it receives (Track, Album, Artist, Playlist, Mix) and displays appropriate
     information and imagery. It handles click events to navigate to detail pages
-    or start playback for tracks.
+    or start playback for tracks. The same card can show different items over
+    time, as a recycled child of HTCardGridView.
     """
 
     __gtype_name__ = "HTCardWidget"
@@ -48,11 +49,14 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
 
     track_artist_label = Gtk.Template.Child()
 
-    def __init__(self, item: Union[Track, Album, Artist, Playlist, Mix, MixV2]) -> None:
+    def __init__(
+        self, item: Union[Track, Album, Artist, Playlist, Mix, MixV2, None] = None
+    ) -> None:
         """Initialize the card widget with a TIDAL item.
 
         Args:
-            item: A TIDAL object (Track, Album, Artist, Playlist, or Mix) to display
+            item: A TIDAL object (Track, Album, Artist, Playlist, or Mix) to display,
+                or None to set it later with set_item
         """
         IDisconnectable.__init__(self)
         super().__init__()
@@ -67,12 +71,46 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
             self.click_gesture.connect("released", self._on_click),
         ))
 
-        self.item: Union[Track, Album, Artist, Playlist, Mix, MixV2] = item
+        self.item: Union[Track, Album, Artist, Playlist, Mix, MixV2, None] = None
 
         self.action: str | None = None
 
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
+
+        if item is not None:
+            self.set_item(item)
+
+    def set_item(self, item: Union[Track, Album, Artist, Playlist, Mix, MixV2]) -> None:
+        """Show an item, replacing the one shown before if any.
+
+        Args:
+            item: A TIDAL object (Track, Album, Artist, Playlist, or Mix) to display
+        """
+        if self.item is not None:
+            self.unbind()
+
+        self.item = item
+        self.action = None
+
+        self.title_label.set_label("")
+        self.title_label.set_tooltip_text(None)
+        self.detail_label.set_label("")
+        self.detail_label.set_visible(True)
+        self.track_artist_label.set_label("")
+        self.track_artist_label.set_visible(True)
+
         self._populate()
 
+    def unbind(self) -> None:
+        """Stop loading the image of the shown item and clear it"""
+        self.cancellable.cancel()
+        self.cancellables.remove(self.cancellable)
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
+
+        self.image.set_from_icon_name("emblem-music-symbolic")
+
     def _populate(self):
         if isinstance(self.item, MixV2) or isinstance(self.item, Mix):
             self._make_mix_card()
@@ -101,9 +139,7 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
         )
         self.detail_label.set_visible(False)
 
-        threading.Thread(
-            target=utils.add_image, args=(self.image, self.item.album)
-        ).start()
+        utils.queue_image(self.image, self.item.album, self.cancellable)
 
     def _make_mix_card(self) -> None:
         """Configure the card to display a Mix item"""
@@ -112,7 +148,7 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
         self.detail_label.set_label(self.item.sub_title)
         self.track_artist_label.set_visible(False)
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _make_album_card(self) -> None:
         """Configure the card to display an Album item"""
@@ -121,7 +157,7 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
         self.track_artist_label.set_artists(self.item.artists)
         self.detail_label.set_visible(False)
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _make_playlist_card(self) -> None:
         """Configure the card to display a Playlist item"""
@@ -134,7 +170,7 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
             creator_name = self.item.creator.name
         self.detail_label.set_label(_("By {}").format(creator_name))
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _make_artist_card(self) -> None:
         """Configure the card to display an Artist item"""
@@ -143,24 +179,24 @@ class HTCardWidget(Adw.BreakpointBin, IDisconnectable):
         self.detail_label.set_label(_("Artist"))
         self.track_artist_label.set_visible(False)
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _make_page_item_card(self) -> None:
         """Configure the card to display a PageItem"""
 
-        def _get_item():
-            if self.item.type == "PLAYLIST":
-                self.item = utils.get_playlist(self.item.artifact_id)
-            elif self.item.type == "TRACK":
-                self.item = utils.get_track(self.item.artifact_id)
-            elif self.item.type == "ARTIST":
-                self.item = utils.get_artist(self.item.artifact_id)
-            elif self.item.type == "ALBUM":
-                self.item = utils.get_album(self.item.artifact_id)
+        cancellable = self.cancellable
+
+        def _populate(item):
+            if not cancellable.is_cancelled():
+                self.item = item
+                self._populate()
 
-            GLib.idle_add(self._populate)
+        def _on_resolved(item):
+            if item is None or cancellable.is_cancelled():
+                return
+            GLib.idle_add(_populate, item)
 
-        threading.Thread(target=_get_item).start()
+        utils.cache.resolve(self.item.type.lower(), self.item.artifact_id, _on_resolved)
 
     def _on_click(self, *args) -> None:
         """Handle click events on the card.
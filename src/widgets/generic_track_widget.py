@@ -20,8 +20,9 @@
 
 import threading
 from gettext import gettext as _
+from typing import List
 
-from gi.repository import Gio, GLib, GObject, Gtk
+from gi.repository import Adw, Gio, GLib, Gtk
 from tidalapi import UserPlaylist
 
 from ..disconnectable_iface import IDisconnectable
@@ -30,16 +31,72 @@ from ..lib import utils
 import logging
 logger = logging.getLogger(__name__)
 
+# The context menu is the same for every row, so it is built once and the
+# actions are looked up in the action group of the row that opened it
+_track_menu: Gio.Menu | None = None
+_playlists_submenu: Gio.Menu | None = None
+_submenu_playlists: List[str] = []
+
+
+def get_track_menu() -> Gio.Menu:
+    """Get the context menu shared by all the track rows.
+
+    Returns:
+        Gio.Menu: The menu, using the trackwidget actions
+    """
+    global _track_menu, _playlists_submenu
+
+    if _track_menu is None:
+        _track_menu = Gio.Menu()
+        _track_menu.append(_("Go to album"), "trackwidget.go-to-album")
+        _track_menu.append(_("Go to track radio"), "trackwidget.go-to-track-radio")
+        _track_menu.append(_("Play next"), "trackwidget.play-next")
+        _track_menu.append(_("Add to queue"), "trackwidget.add-to-queue")
+        _track_menu.append(
+            _("Add to my collection"), "trackwidget.add-to-my-collection"
+        )
+        _track_menu.append(_("Copy share url"), "trackwidget.copy-share-url")
+
+        _playlists_submenu = Gio.Menu()
+        _track_menu.append_submenu(_("Add to a playlist"), _playlists_submenu)
+
+        update_playlists_submenu()
+
+    return _track_menu
+
+
+def update_playlists_submenu() -> None:
+    """Refresh the playlists of the shared menu if the user playlists changed"""
+    global _submenu_playlists
+
+    if _playlists_submenu is None:
+        return
+
+    names = [playlist.name for playlist in utils.user_playlists[:11]]
+    if names == _submenu_playlists:
+        return
+    _submenu_playlists = names
+
+    _playlists_submenu.remove_all()
+    for index, name in enumerate(names):
+        item = Gio.MenuItem.new()
+        item.set_label(name)
+        item.set_action_and_target_value(
+            "trackwidget.add-to-playlist", GLib.Variant.new_int16(index)
+        )
+        _playlists_submenu.append_item(item)
+
 
 @Gtk.Template(
     resource_path="/io/github/nokse22/high-tide/ui/widgets/generic_track_widget.ui"
 )
-class HTGenericTrackWidget(Gtk.ListBoxRow, IDisconnectable):
+class HTGenericTrackWidget(Adw.Bin, IDisconnectable):
     """A widget for displaying a single track with playback and menu options.
 
     This widget shows track information including title, artist, album, duration,
     and cover art. It provides context menu actions for playing, adding to queue,
-    adding to playlists, and other track-related operations.
+    adding to playlists, and other track-related operations. The same widget can
+    show different tracks over time, as a recycled row of HTTrackListView.
     """
 
     __gtype_name__ = "HTGenericTrackWidget"
@@ -47,7 +104,6 @@ class HTGenericTrackWidget(Gtk.ListBoxRow, IDisconnectable):
     image = Gtk.Template.Child()
     track_title_label = Gtk.Template.Child()
     track_duration_label = Gtk.Template.Child()
-    playlists_submenu = Gtk.Template.Child()
     _grid = Gtk.Template.Child()
     explicit_label = Gtk.Template.Child()
 
@@ -56,16 +112,15 @@ class HTGenericTrackWidget(Gtk.ListBoxRow, IDisconnectable):
     track_album_label = Gtk.Template.Child()
 
     menu_button = Gtk.Template.Child()
-    track_menu = Gtk.Template.Child()
 
-    index = GObject.Property(type=int, default=0)
-
-    def __init__(self, track):
+    def __init__(self, track=None):
         IDisconnectable.__init__(self)
         super().__init__()
 
-        self.menu_activated = False
-        self.track = track
+        self.track = None
+
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
 
         self.signals.append((
             self.artist_label,
@@ -80,10 +135,21 @@ class HTGenericTrackWidget(Gtk.ListBoxRow, IDisconnectable):
             self.track_album_label.connect("activate-link", utils.open_uri),
         ))
 
-        self.signals.append((
-            self.menu_button,
-            self.menu_button.connect("notify::active", self._on_menu_activate),
-        ))
+        self.menu_button.set_create_popup_func(self._create_menu)
+
+        if track is not None:
+            self.set_track(track)
+
+    def set_track(self, track):
+        """Show a track, replacing the one shown before if any.
+
+        Args:
+            track: The track to show
+        """
+        if self.track is not None:
+            self.unbind()
+
+        self.track = track
 
         self.track_album_label.set_album(self.track.album)
         self.track_title_label.set_label(
@@ -91,44 +157,44 @@ class HTGenericTrackWidget(Gtk.ListBoxRow, IDisconnectable):
             if hasattr(self.track, "full_name")
             else self.track.name
         )
+        self.artist_label.set_label("")
         self.artist_label.set_artists(self.track.artists)
 
         self.explicit_label.set_visible(self.track.explicit)
 
         self.track_duration_label.set_label(utils.pretty_duration(self.track.duration))
 
-        if not self.track.available:
-            self.set_activatable(False)
-            self.set_sensitive(False)
-
-        threading.Thread(
-            target=utils.add_image, args=(self.image, self.track.album)
-        ).start()
+        self.set_sensitive(self.track.available)
 
-        self.action_group = Gio.SimpleActionGroup()
-        self.insert_action_group("trackwidget", self.action_group)
-
-    def _on_menu_activate(self, *args):
-        if self.menu_activated:
-            return
+        utils.queue_image(self.image, self.track.album, self.cancellable)
 
-        self.menu_activated = True
+    def unbind(self):
+        """Stop loading the cover of the shown track and clear it"""
+        self.cancellable.cancel()
+        self.cancellables.remove(self.cancellable)
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
 
-        self.track_menu.prepend(
-            _("Go to track radio"), f"win.push-track-radio-page::{self.track.id}"
-        )
+        self.image.set_from_icon_name("emblem-music-symbolic")
 
-        self.track_menu.prepend(
-            _("Go to album"), f"win.push-album-page::{self.track.album.id}"
-        )
+    def _create_menu(self, menu_button):
+        # Called every time the menu is about to be shown, the actions are
+        # only created the first time and most rows never get here
+        update_playlists_submenu()
+        if menu_button.get_menu_model() is not None:
+            return
 
         action_entries = [
+            ("go-to-album", self._go_to_album),
+            ("go-to-track-radio", self._go_to_track_radio),
             ("play-next", self._play_next),
             ("add-to-queue", self._add_to_queue),
             ("add-to-my-collection", self._th_add_to_my_collection),
             ("copy-share-url", self._copy_share_url),
         ]
 
+        action_group = Gio.SimpleActionGroup()
+
         add_to_playlist_action = Gio.SimpleAction.new(
             "add-to-playlist", GLib.VariantType.new("n")
         )
@@ -136,22 +202,25 @@ class HTGenericTrackWidget(Gtk.ListBoxRow, IDisconnectable):
             add_to_playlist_action,
             add_to_playlist_action.connect("activate", self._add_to_playlist),
         ))
-        self.action_group.add_action(add_to_playlist_action)
-
-        for index, playlist in enumerate(utils.user_playlists):
-            if index > 10:
-                break
-            item = Gio.MenuItem.new()
-            item.set_label(playlist.name)
-            item.set_action_and_target_value(
-                "trackwidget.add-to-playlist", GLib.Variant.new_int16(index)
-            )
-            self.playlists_submenu.insert_item(index, item)
+        action_group.add_action(add_to_playlist_action)
 
         for name, callback in action_entries:
             action = Gio.SimpleAction.new(name, None)
             self.signals.append((action, action.connect("activate", callback)))
-            self.action_group.add_action(action)
+            action_group.add_action(action)
+
+        self.insert_action_group("trackwidget", action_group)
+        menu_button.set_menu_model(get_track_menu())
+
+    def _go_to_album(self, *args):
+        self.activate_action(
+            "win.push-album-page", GLib.Variant("s", str(self.track.album.id))
+        )
+
+    def _go_to_track_radio(self, *args):
+        self.activate_action(
+            "win.push-track-radio-page", GLib.Variant("s", str(self.track.id))
+        )
 
     def _play_next(self, *args):
         utils.player_object.add_next(self.track)
@@ -171,6 +240,8 @@ class HTGenericTrackWidget(Gtk.ListBoxRow, IDisconnectable):
 
         if isinstance(selected_playlist, UserPlaylist):
             selected_playlist.add([self.track.id])
+            # Do not serve the stored copy without the new track
+            utils.cache.invalidate("playlist", selected_playlist.id)
 
             logger.info(f"Added to playlist: {selected_playlist.name}")
 
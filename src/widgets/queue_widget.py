@@ -17,9 +17,11 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Gtk
+from gettext import gettext as _
 
-from ..widgets.generic_track_widget import HTGenericTrackWidget
+from gi.repository import Gio, Gtk, Pango
+
+from .track_list_view import HTTrackItem, HTTrackListView
 
 
 @Gtk.Template(resource_path="/io/github/nokse22/high-tide/ui/widgets/queue_widget.ui")
@@ -29,67 +31,128 @@ class HTQueueWidget(Gtk.Box):
 
     __gtype_name__ = "HTQueueWidget"
 
-    played_songs_list = Gtk.Template.Child()
-    queued_songs_list = Gtk.Template.Child()
-    next_songs_list = Gtk.Template.Child()
+    scrolled_window = Gtk.Template.Child()
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.played_songs = Gio.ListStore(item_type=HTTrackItem)
+        self.queued_songs = Gio.ListStore(item_type=HTTrackItem)
+        self.next_songs = Gio.ListStore(item_type=HTTrackItem)
+
+        # What the stores were last updated from, to apply the moves of a
+        # song change without comparing the whole lists
+        self._history: tuple | None = None
+        self._queue_history: tuple | None = None
+        self._next_state: tuple | None = None
+
+        # Each store is a section of a single list, so only the visible rows
+        # of the whole queue have a widget
+        self.sections = [
+            (self.played_songs, _("Played Songs")),
+            (self.queued_songs, _("Queue")),
+            (self.next_songs, _("Next Songs")),
+        ]
+        stores = Gio.ListStore(item_type=Gio.ListModel)
+        for store, _title in self.sections:
+            stores.append(store)
+
+        header_factory = Gtk.SignalListItemFactory()
+        header_factory.connect("setup", self._on_header_setup)
+        header_factory.connect("bind", self._on_header_bind)
 
-    played_songs_box = Gtk.Template.Child()
-    queued_songs_box = Gtk.Template.Child()
-    next_songs_box = Gtk.Template.Child()
+        self.list_view = HTTrackListView(
+            Gtk.FlattenListModel(model=stores),
+            header_factory=header_factory,
+            margin_top=12,
+            margin_bottom=12,
+            margin_start=12,
+            margin_end=12,
+        )
+        self.scrolled_window.set_child(self.list_view)
 
     def update_all(self, player) -> None:
-        """Updates played songs, queue and next songs"""
+        """Updates played songs, queue and next songs
+
+        On a song change only the rows that moved are touched, so the cost
+        does not grow with the length of the lists. Other changes, like
+        a new context or shuffling, fall back to a diff of the whole lists.
+        """
         self.update_played_songs(player)
         self.update_queue(player)
         self.update_next_songs(player)
 
     def update_played_songs(self, player) -> None:
         """Updates played songs"""
-        child = self.played_songs_list.get_row_at_index(0)
-        while child:
-            self.played_songs_list.remove(child)
-            del child
-            child = self.played_songs_list.get_row_at_index(0)
-
-        if len(player.played_songs) > 0:
-            self.played_songs_box.set_visible(True)
-            for index, track in enumerate(player.played_songs):
-                listing = HTGenericTrackWidget(track)
-                listing.set_name(str(index))
-                self.played_songs_list.append(listing)
+        # Without other changes, play_next() only appends played songs
+        history = (player.played_songs, player.history_version)
+        count = self.played_songs.get_n_items()
+        if self._same(history, self._history) and count <= len(history[0]):
+            if count < len(history[0]):
+                self.played_songs.splice(
+                    count, 0, HTTrackListView.items_for(player.played_songs[count:])
+                )
         else:
-            self.played_songs_box.set_visible(False)
+            HTTrackListView.update_store(self.played_songs, player.played_songs)
+        self._history = history
 
     def update_queue(self, player) -> None:
         """Updates the queue"""
-        child = self.queued_songs_list.get_row_at_index(0)
-        while child:
-            self.queued_songs_list.remove(child)
-            del child
-            child = self.queued_songs_list.get_row_at_index(0)
-
-        if len(player.queue) > 0:
-            self.queued_songs_box.set_visible(True)
-            for index, track in enumerate(player.queue):
-                listing = HTGenericTrackWidget(track)
-                listing.set_name(str(index))
-                self.queued_songs_list.append(listing)
+        # Without other changes, play_next() only pops from the queue
+        history = (player.queue, player.history_version)
+        removed = self.queued_songs.get_n_items() - len(player.queue)
+        if self._same(history, self._queue_history) and removed >= 0:
+            if removed:
+                self.queued_songs.splice(0, removed, [])
         else:
-            self.queued_songs_box.set_visible(False)
+            HTTrackListView.update_store(self.queued_songs, player.queue)
+        self._queue_history = history
 
     def update_next_songs(self, player) -> None:
         """Updates next songs"""
-        child = self.next_songs_list.get_row_at_index(0)
-        while child:
-            self.next_songs_list.remove(child)
-            del child
-            child = self.next_songs_list.get_row_at_index(0)
-
-        if len(player.tracks_to_play) > 0:
-            self.next_songs_box.set_visible(True)
-            for index, track in enumerate(player.tracks_to_play):
-                listing = HTGenericTrackWidget(track)
-                listing.set_name(str(index))
-                self.next_songs_list.append(listing)
+        play_queue = player.play_queue
+        state = (play_queue, play_queue.version, play_queue.position)
+
+        if self._same(state[:2], self._next_state and self._next_state[:2]):
+            # Only the position moved, so rows leave or come back at the top
+            old_position = self._next_state[2]
+            position = state[2]
+            if position > old_position:
+                moved = play_queue.fetched_between(old_position + 1, position + 1)
+                self.next_songs.splice(0, len(moved), [])
+            elif position < old_position:
+                moved = play_queue.fetched_between(position + 1, old_position + 1)
+                self.next_songs.splice(0, 0, HTTrackListView.items_for(moved))
         else:
-            self.next_songs_box.set_visible(False)
+            HTTrackListView.update_store(self.next_songs, player.tracks_to_play)
+        self._next_state = state
+
+    @staticmethod
+    def _same(state: tuple, old_state: tuple | None) -> bool:
+        # The object is compared by identity, since comparing lists by value
+        # is what the states are there to avoid
+        return (
+            old_state is not None
+            and state[0] is old_state[0]
+            and state[1] == old_state[1]
+        )
+
+    def _on_header_setup(self, factory, list_header) -> None:
+        list_header.set_child(
+            Gtk.Label(
+                css_classes=["title-4"],
+                ellipsize=Pango.EllipsizeMode.END,
+                xalign=0.0,
+                margin_top=12,
+                margin_bottom=6,
+            )
+        )
+
+    def _on_header_bind(self, factory, list_header) -> None:
+        # Empty sections have no header, so find the one starting here
+        start = list_header.get_start()
+        for store, title in self.sections:
+            if start < store.get_n_items():
+                list_header.get_child().set_label(title)
+                return
+            start -= store.get_n_items()
@@ -17,11 +17,10 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import threading
 from gettext import gettext as _
 from typing import List, Union
 
-from gi.repository import GLib, Gtk
+from gi.repository import Gio, GLib, Gtk
 from tidalapi import Album, Artist, Mix, MixV2, Playlist
 
 from ..disconnectable_iface import IDisconnectable
@@ -48,6 +47,9 @@ class HTShorcutWidget(Gtk.FlowBoxChild, IDisconnectable):
         self.action: str | None = None
         self.item: Union[Mix, MixV2, Album, Artist, Playlist] = item
 
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
+
         self.signals.append((
             self.click_gesture,
             self.click_gesture.connect("released", self._on_click),
@@ -73,7 +75,7 @@ class HTShorcutWidget(Gtk.FlowBoxChild, IDisconnectable):
             self.subtitle_label.set_label(_("By {}").format(creator_name))
             self.action = "win.push-playlist-page"
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _on_click(self, *args) -> None:
         if self.action is None:
@@ -106,4 +108,6 @@ class HTShorcutsWidget(Gtk.Box, IDisconnectable):
         if items_list is None:
             return
         for item in items_list:
-            self.shorcuts_flow_box.append(HTShorcutWidget(item))
+            shortcut = HTShorcutWidget(item)
+            self.disconnectables.append(shortcut)
+            self.shorcuts_flow_box.append(shortcut)
@@ -17,10 +17,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import threading
 from gettext import gettext as _
 
-from gi.repository import GLib, Gtk
+from gi.repository import Gio, GLib, Gtk
 from tidalapi import Album, Artist, Mix, Playlist, Track
 
 from ..disconnectable_iface import IDisconnectable
@@ -54,6 +53,9 @@ class HTTopHitWidget(Gtk.Box, IDisconnectable):
 
         self.action = None
 
+        self.cancellable = Gio.Cancellable.new()
+        self.cancellables.append(self.cancellable)
+
         if isinstance(_item, Mix):
             self._make_mix()
             self.action = "win.push-mix-page"
@@ -94,9 +96,7 @@ class HTTopHitWidget(Gtk.Box, IDisconnectable):
             ),
         ))
 
-        threading.Thread(
-            target=utils.add_image, args=(self.image, self.item.album)
-        ).start()
+        utils.queue_image(self.image, self.item.album, self.cancellable)
 
     def _make_mix(self) -> None:
         self.primary_label.set_label(self.item.title)
@@ -119,7 +119,7 @@ class HTTopHitWidget(Gtk.Box, IDisconnectable):
             ),
         ))
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _make_album(self) -> None:
         self.primary_label.set_label(self.item.name)
@@ -142,7 +142,7 @@ class HTTopHitWidget(Gtk.Box, IDisconnectable):
             ),
         ))
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _make_playlist(self) -> None:
         self.primary_label.set_label(self.item.name)
@@ -166,7 +166,7 @@ class HTTopHitWidget(Gtk.Box, IDisconnectable):
             ),
         ))
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
 
     def _make_artist(self) -> None:
         self.primary_label.set_label(self.item.name)
@@ -175,4 +175,4 @@ class HTTopHitWidget(Gtk.Box, IDisconnectable):
         self.play_button.set_visible(False)
         self.shuffle_button.set_visible(False)
 
-        threading.Thread(target=utils.add_image, args=(self.image, self.item)).start()
+        utils.queue_image(self.image, self.item, self.cancellable)
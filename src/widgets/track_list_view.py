@@ -0,0 +1,154 @@
+# track_list_view.py
+#
+# Copyright 2025 Nokse <nokse@posteo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import List
+
+from gi.repository import Gio, GObject, Gtk
+from tidalapi import Track
+
+from ..disconnectable_iface import IDisconnectable
+from .generic_track_widget import HTGenericTrackWidget
+
+
+class HTTrackItem(GObject.Object):
+    """A track in the model of a HTTrackListView"""
+
+    __gtype_name__ = "HTTrackItem"
+
+    track = GObject.Property(type=object)
+
+
+class HTTrackListView(Gtk.ListView, IDisconnectable):
+    """A list of tracks that only creates widgets for the visible rows.
+
+    The tracks are kept in a Gio.ListStore of lightweight HTTrackItem, and a
+    small pool of HTGenericTrackWidget is bound to the items as they scroll
+    into view and unbound when they scroll out.
+    """
+
+    __gtype_name__ = "HTTrackListView"
+
+    __gsignals__ = {
+        "track-activated": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+    }
+
+    def __init__(self, model: Gio.ListModel | None = None, **kwargs) -> None:
+        """Create the list.
+
+        Args:
+            model: A model of HTTrackItem to show, if None the list uses its own
+                store that is filled with append_tracks and set_tracks
+        """
+        super().__init__(**kwargs)
+        IDisconnectable.__init__(self)
+
+        self.store = Gio.ListStore(item_type=HTTrackItem)
+        self.set_model(
+            Gtk.NoSelection(model=model if model is not None else self.store)
+        )
+
+        factory = Gtk.SignalListItemFactory()
+        self.signals.append((factory, factory.connect("setup", self._on_setup)))
+        self.signals.append((factory, factory.connect("bind", self._on_bind)))
+        self.signals.append((factory, factory.connect("unbind", self._on_unbind)))
+        self.signals.append((factory, factory.connect("teardown", self._on_teardown)))
+        self.set_factory(factory)
+
+        self.set_single_click_activate(True)
+        self.add_css_class("tracks-list-box")
+
+        self.signals.append((self, self.connect("activate", self._on_activate)))
+
+    @staticmethod
+    def items_for(tracks: List[Track]) -> List[HTTrackItem]:
+        """Wrap tracks into list items.
+
+        Args:
+            tracks: The tracks
+
+        Returns:
+            list: The items
+        """
+        return [HTTrackItem(track=track) for track in tracks]
+
+    @staticmethod
+    def update_store(store: Gio.ListStore, tracks: List[Track]) -> None:
+        """Make a store hold the given tracks with a single minimal splice.
+
+        Only the tracks between the common start and the common end of the
+        old and new lists are replaced, so removing the first track or
+        appending one touches a single row and the other rows stay bound.
+
+        Args:
+            store: A store of HTTrackItem
+            tracks: The tracks the store should hold
+        """
+        old = [store.get_item(index).track.id for index in range(store.get_n_items())]
+        new = [track.id for track in tracks]
+
+        prefix = 0
+        limit = min(len(old), len(new))
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+
+        removed = len(old) - prefix - suffix
+        added = tracks[prefix : len(new) - suffix]
+        if removed or added:
+            store.splice(prefix, removed, HTTrackListView.items_for(added))
+
+    def append_tracks(self, tracks: List[Track]) -> None:
+        """Add tracks at the end of the list.
+
+        Args:
+            tracks: The tracks to add
+        """
+        self.store.splice(self.store.get_n_items(), 0, self.items_for(tracks))
+
+    def set_tracks(self, tracks: List[Track]) -> None:
+        """Replace all the tracks of the list.
+
+        Args:
+            tracks: The new tracks
+        """
+        self.store.splice(0, self.store.get_n_items(), self.items_for(tracks))
+
+    def _on_setup(self, factory, list_item) -> None:
+        widget = HTGenericTrackWidget()
+        self.disconnectables.append(widget)
+        list_item.set_child(widget)
+
+    def _on_bind(self, factory, list_item) -> None:
+        track = list_item.get_item().track
+        list_item.set_activatable(track.available)
+        list_item.get_child().set_track(track)
+
+    def _on_unbind(self, factory, list_item) -> None:
+        list_item.get_child().unbind()
+
+    def _on_teardown(self, factory, list_item) -> None:
+        widget = list_item.get_child()
+        if widget in self.disconnectables:
+            self.disconnectables.remove(widget)
+            widget.disconnect_all()
+
+    def _on_activate(self, list_view, position: int) -> None:
+        self.emit("track-activated", position)
@@ -24,7 +24,7 @@ from tidalapi import Track
 
 from ..disconnectable_iface import IDisconnectable
 from ..lib import utils
-from .generic_track_widget import HTGenericTrackWidget
+from .track_list_view import HTTrackListView
 
 
 @Gtk.Template(
@@ -56,9 +56,13 @@ class HTTracksListWidget(Gtk.Box, IDisconnectable):
 
         self.get_function: Callable = None
 
+        self.tracks_list_view = HTTrackListView()
+        self.disconnectables.append(self.tracks_list_view)
+        self.tracks_list_box.append(self.tracks_list_view)
+
         self.signals.append((
-            self.tracks_list_box,
-            self.tracks_list_box.connect("row-activated", self._on_tracks_row_selected),
+            self.tracks_list_view,
+            self.tracks_list_view.connect("track-activated", self._on_track_activated),
         ))
 
         self.tracks: List[Track] = []
@@ -80,11 +84,7 @@ class HTTracksListWidget(Gtk.Box, IDisconnectable):
         self._add_tracks()
 
     def _add_tracks(self):
-        for index, track in enumerate(self.tracks):
-            listing = HTGenericTrackWidget(track)
-            self.disconnectables.append(listing)
-            listing.set_name(str(index))
-            self.tracks_list_box.append(listing)
+        self.tracks_list_view.set_tracks(self.tracks)
 
     def _on_more_clicked(self, *args) -> None:
         from ..pages import HTFromFunctionPage
@@ -94,7 +94,5 @@ class HTTracksListWidget(Gtk.Box, IDisconnectable):
         page.load()
         utils.navigation_view.push(page)
 
-    def _on_tracks_row_selected(self, list_box, row) -> None:
-        index = int(row.get_name())
-
+    def _on_track_activated(self, list_view, index: int) -> None:
         utils.player_object.play_this(self.tracks, index)
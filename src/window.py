@@ -148,6 +148,7 @@ class HighTideWindow(Adw.ApplicationWindow):
 
         self.player_object.connect("notify::shuffle", self.on_shuffle_changed)
         self.player_object.connect("update-slider", self.update_slider)
+        self.player_object.connect("volume-changed", self.on_player_volume_changed)
         self.player_object.connect("song-changed", self.on_song_changed)
         self.player_object.connect("song-added-to-queue", self.on_song_added_to_queue)
         self.player_object.connect("notify::playing", self.update_controls)
@@ -182,7 +183,8 @@ class HighTideWindow(Adw.ApplicationWindow):
         utils.session = self.session
         utils.navigation_view = self.navigation_view
         utils.toast_overlay = self.toast_overlay
-        utils.cache = HTCache(self.session)
+        utils.cache.close()
+        utils.cache = HTCache(self.session, utils.metadata_store)
 
         self.user = self.session.user
 
@@ -194,7 +196,7 @@ class HighTideWindow(Adw.ApplicationWindow):
         self.favourite_playlists = []
         self.my_playlists = []
 
-        self.image_canc = None
+        self.image_canc = Gio.Cancellable.new()
 
         self.queued_uri = None
         self.is_logged_in = False
@@ -218,6 +220,12 @@ class HighTideWindow(Adw.ApplicationWindow):
 
         self.connect("notify::is-active", self.stop_video_in_background)
 
+        self.connect("notify::suspended", self.update_position_interval)
+        self.connect("notify::visible", self.update_position_interval)
+        for bar in (self.progress_bar, self.small_progress_bar):
+            bar.connect("map", self.update_position_interval)
+            bar.connect("unmap", self.update_position_interval)
+
         if not self.settings.get_boolean("app-id-change-understood"):
             self.app_id_dialog.present(self)
 
@@ -265,6 +273,9 @@ class HighTideWindow(Adw.ApplicationWindow):
         not logged in page.
         """
         self.secret_store.clear()
+        utils.metadata_store.clear()
+        utils.cache.close()
+        utils.cache = HTCache(self.session, utils.metadata_store)
 
         page = HTNotLoggedInPage().load()
         self.navigation_view.replace([page])
@@ -366,30 +377,35 @@ class HighTideWindow(Adw.ApplicationWindow):
             self.videoplayer.clear()
 
         if self.video_covers_enabled and album.video_cover:
-            threading.Thread(
-                target=utils.add_video_cover,
-                args=(
-                    self.playing_track_picture,
-                    self.videoplayer,
-                    album,
-                    self.in_background,
-                    self.image_canc,
-                ),
-            ).start()
+            utils.artwork_loader.submit(
+                utils.add_video_cover,
+                self.playing_track_picture,
+                self.videoplayer,
+                album,
+                self.in_background,
+                self.image_canc,
+                utils.get_best_dimensions(self.playing_track_picture),
+                cancellable=self.image_canc,
+                priority=utils.Priority.HIGH,
+            )
         else:
-            threading.Thread(
-                target=utils.add_picture,
-                args=(self.playing_track_picture, album, self.image_canc),
-            ).start()
+            utils.queue_image(
+                self.playing_track_picture,
+                album,
+                self.image_canc,
+                add_function=utils.add_picture,
+                priority=utils.Priority.HIGH,
+            )
 
-        threading.Thread(
-            target=utils.add_image, args=(self.playing_track_image, album)
-        ).start()
+        utils.queue_image(
+            self.playing_track_image, album, priority=utils.Priority.HIGH
+        )
 
         threading.Thread(target=self.th_add_lyrics_to_page, args=()).start()
 
         self.control_bar_artist = track.artist
         self.update_slider()
+        self.update_position_interval()
 
         if self.queue_widget.get_mapped():
             self.queue_widget.update_all(self.player_object)
@@ -632,15 +648,14 @@ class HighTideWindow(Adw.ApplicationWindow):
     def update_slider(self, *args):
         """Update the progress bar and playback information.
 
-        Called periodically to update the progress bar, song duration, current position
-        and volume level.
+        Called periodically to update the progress bar, song duration and current
+        position, as often as the visible progress bar can show a change.
         """
         # Just copy the duration from player here to avoid ui desync from player object
         self.duration = self.player_object.duration
         end_value = self.duration / Gst.SECOND
 
-        self.volume_button.get_adjustment().set_value(self.player_object.query_volume())
-        position = self.player_object.query_position(default=None)
+        position = self.player_object.get_position(default=None)
         if position is None:
             return
         position = position / Gst.SECOND
@@ -648,16 +663,49 @@ class HighTideWindow(Adw.ApplicationWindow):
 
         self.lyrics_widget.set_time(position)
 
-        self.duration_label.set_label(utils.pretty_duration(end_value))
+        duration_text = utils.pretty_duration(end_value)
+        if self.duration_label.get_label() != duration_text:
+            self.duration_label.set_label(duration_text)
 
         if end_value != 0:
-            fraction = position / end_value
+            fraction = min(position / end_value, 1)
         self.small_progress_bar.set_fraction(fraction)
         self.progress_bar.get_adjustment().set_value(fraction)
 
         self.previous_fraction = fraction
 
-        self.time_played_label.set_label(utils.pretty_duration(position))
+        position_text = utils.pretty_duration(position)
+        if self.time_played_label.get_label() != position_text:
+            self.time_played_label.set_label(position_text)
+
+        self.update_position_interval()
+
+    def update_position_interval(self, *args):
+        """Adapt how often the player reports the position to what is visible.
+
+        The position is updated once per pixel of the visible progress bar,
+        at most at frame rate and at least once per second, and not at all
+        while no progress bar is on screen.
+        """
+        if self.progress_bar.get_mapped():
+            bar = self.progress_bar
+        else:
+            bar = self.small_progress_bar
+
+        if not self.get_visible() or self.is_suspended() or not bar.get_mapped():
+            self.player_object.set_update_interval(0)
+            return
+
+        width = bar.get_width()
+        duration_ms = self.player_object.duration / Gst.MSECOND
+        if width > 0 and duration_ms > 0:
+            interval = int(min(max(duration_ms / width, 16), 1000))
+        else:
+            interval = 1000
+        self.player_object.set_update_interval(interval)
+
+    def on_player_volume_changed(self, _player, volume):
+        self.volume_button.get_adjustment().set_value(volume)
 
     def th_add_lyrics_to_page(self):
         try:
@@ -684,6 +732,7 @@ class HighTideWindow(Adw.ApplicationWindow):
                 self.session.audio_quality = Quality.hi_res_lossless
 
         self.settings.set_int("quality", pos)
+        self.player_object.invalidate_prefetch()
 
     def change_audio_sink(self, sink):
         if self.settings.get_int("preferred-sink") != sink:
@@ -693,19 +742,12 @@ class HighTideWindow(Adw.ApplicationWindow):
     def change_alsa_device(self, device: str):
         if self.settings.get_string("alsa-device") != device:
             self.settings.set_string("alsa-device", device)
-            self.player_object.alsa_device = device
-            self.player_object.change_audio_sink(
-                self.settings.get_int("preferred-sink")
-            )
+            self.player_object.change_alsa_device(device)
 
     def change_normalization(self, state):
         if self.player_object.normalize != state:
-            self.player_object.normalize = state
+            self.player_object.change_normalization(state)
             self.settings.set_boolean("normalize", state)
-            # recreate audio pipeline, kinda dirty ngl
-            self.player_object.change_audio_sink(
-                self.settings.get_int("preferred-sink")
-            )
 
     def change_quadratic_volume(self, state):
         if self.settings.get_boolean("quadratic-volume") != state:
@@ -725,20 +767,35 @@ class HighTideWindow(Adw.ApplicationWindow):
             self.videoplayer.clear()
 
             if self.video_covers_enabled and album.video_cover:
-                threading.Thread(
-                    target=utils.add_video_cover,
-                    args=(
-                        self.playing_track_picture,
-                        self.videoplayer,
-                        album,
-                        self.image_canc,
-                    ),
-                ).start()
+                utils.artwork_loader.submit(
+                    utils.add_video_cover,
+                    self.playing_track_picture,
+                    self.videoplayer,
+                    album,
+                    self.in_background,
+                    self.image_canc,
+                    utils.get_best_dimensions(self.playing_track_picture),
+                    cancellable=self.image_canc,
+                    priority=utils.Priority.HIGH,
+                )
             else:
-                threading.Thread(
-                    target=utils.add_picture,
-                    args=(self.playing_track_picture, album, self.image_canc),
-                ).start()
+                utils.queue_image(
+                    self.playing_track_picture,
+                    album,
+                    self.image_canc,
+                    add_function=utils.add_picture,
+                    priority=utils.Priority.HIGH,
+                )
+
+    def change_image_cache_size(self, size_mb: int):
+        if self.settings.get_int("image-cache-size") != size_mb:
+            self.settings.set_int("image-cache-size", size_mb)
+            utils.image_cache.set_max_size(size_mb * 1024 * 1024)
+
+    def change_audio_cache_size(self, size_mb: int):
+        if self.settings.get_int("audio-cache-size") != size_mb:
+            self.settings.set_int("audio-cache-size", size_mb)
+            utils.audio_cache.set_max_size(size_mb * 1024 * 1024)
 
     def change_discord_rpc_enabled(self, state):
         if self.settings.get_boolean("discord-rpc") != state: